@@ -21,8 +21,6 @@ const words = [
 "ABSURDITY",
 "ABUNDANCE",
 "ABUNDANT",
-"ABUSER",
-"ABUSIVE",
 "ABYSS",
 "ACACIA",
 "ACADEMIA",
@@ -106,7 +104,6 @@ const words = [
 "ADORATION",
 "ADRIFT",
 "ADULT",
-"ADULTERY",
 "ADULTHOOD",
 "ADVANCE",
 "ADVANTAGE",
@@ -189,11 +186,9 @@ const words = [
 "ALBUM",
 "ALCHEMIST",
 "ALCHEMY",
-"ALCOHOLIC",
 "ALDERMAN",
 "ALE",
 "ALERT",
-"ALEXANDER",
 "ALGAE",
 "ALGEBRA",
 "ALGEBRAIC",
@@ -248,7 +243,6 @@ const words = [
 "AMBITIOUS",
 "AMBULANCE",
 "AMBUSH",
-"AMEN",
 "AMEND",
 "AMENDMENT",
 "AMETHYST",
@@ -413,7 +407,6 @@ const words = [
 "ARMY",
 "AROMA",
 "AROMATIC",
-"AROUSAL",
 "ARRANGE",
 "ARRAY",
 "ARREARS",
@@ -428,7 +421,6 @@ const words = [
 "ART",
 "ARTERIAL",
 "ARTERY",
-"ARTHRITIS",
 "ARTICLE",
 "ARTIFACT",
 "ARTILLERY",
@@ -477,8 +469,6 @@ const words = [
 "ASTRONOMY",
 "ASTUTE",
 "ASYLUM",
-"ATHEISM",
-"ATHEIST",
 "ATHLETE",
 "ATHLETIC",
 "ATHLETICS",
@@ -637,7 +627,6 @@ const words = [
 "BANNER",
 "BAPTISM",
 "BAPTIST",
-"BAR",
 "BARB",
 "BARBARIAN",
 "BARBARIC",
@@ -716,7 +705,6 @@ const words = [
 "BEDTIME",
 "BEECH",
 "BEEF",
-"BEER",
 "BEET",
 "BEETLE",
 "BEG",
@@ -744,7 +732,6 @@ const words = [
 "BENNET",
 "BENNY",
 "BERG",
-"BERLIN",
 "BERRY",
 "BERSERK",
 "BEST",
@@ -788,14 +775,12 @@ const words = [
 "BIOMASS",
 "BIOPSY",
 "BIOTECH",
-"BIPOLAR",
 "BIRCH",
 "BIRD",
 "BIRDIE",
 "BIRTH",
 "BIRTHDAY",
 "BISCUIT",
-"BISEXUAL",
 "BISHOP",
 "BISON",
 "BISTRO",
@@ -883,7 +868,6 @@ const words = [
 "BOLIVIA",
 "BOLOGNA",
 "BOLSTER",
-"BOMB",
 "BOMBER",
 "BONANZA",
 "BOND",
@@ -911,7 +895,6 @@ const words = [
 "BOOTY",
 "BOOZE",
 "BOP",
-"BORDEAUX",
 "BORDER",
 "BOREDOM",
 "BOROUGH",
@@ -950,7 +933,6 @@ const words = [
 "BOYCOTT",
 "BOYFRIEND",
 "BOYHOOD",
-"BRA",
 "BRACE",
 "BRACELET",
 "BRACKET",
@@ -1062,7 +1044,6 @@ const words = [
 "BULKY",
 "BULL",
 "BULLDOG",
-"BULLET",
 "BULLETIN",
 "BULLION",
 "BULLISH",
@@ -1085,7 +1066,6 @@ const words = [
 "BURGLAR",
 "BURGLARY",
 "BURGUNDY",
-"BURIAL",
 "BURKE",
 "BURLESQUE",
 "BURN",
@@ -1164,8 +1144,6 @@ const words = [
 "CANAL",
 "CANARY",
 "CANCEL",
-"CANCER",
-"CANCEROUS",
 "CANDID",
 "CANDIDACY",
 "CANDIDATE",
@@ -1206,7 +1184,6 @@ const words = [
 "CARBON",
 "CARBONATE",
 "CARCASS",
-"CARCINOMA",
 "CARD",
 "CARDBOARD",
 "CARDIAC",
@@ -1330,7 +1307,6 @@ const words = [
 "CHAMBER",
 "CHAMELEON",
 "CHAMP",
-"CHAMPAGNE",
 "CHAMPAIGN",
 "CHAMPION",
 "CHANCE",
@@ -1490,7 +1466,6 @@ const words = [
 "CLEANUP",
 "CLEAR",
 "CLEARANCE",
-"CLEAVAGE",
 "CLEAVER",
 "CLEMENT",
 "CLERGY",
@@ -1551,7 +1526,6 @@ const words = [
 "COBALT",
 "COBRA",
 "COCA",
-"COCAINE",
 "COCKPIT",
 "COCKROACH",
 "COCKTAIL",
@@ -1566,7 +1540,6 @@ const words = [
 "COERCION",
 "COEXIST",
 "COFFEE",
-"COFFIN",
 "COG",
 "COGNITION",
 "COGNITIVE",
@@ -1907,7 +1880,6 @@ const words = [
 "CREEK",
 "CREEP",
 "CREEPY",
-"CREMATION",
 "CREOLE",
 "CRESCENT",
 "CREST",
@@ -2034,17 +2006,13 @@ const words = [
 "CYSTIC",
 "DAB",
 "DAD",
-"DADA",
 "DADDY",
 "DAFT",
 "DAGGER",
-"DAH",
 "DAHL",
 "DAINTY",
 "DAIRY",
 "DAISY",
-"DAK",
-"DAL",
 "DALE",
 "DAM",
 "DAMAGE",
@@ -2163,7 +2131,6 @@ const words = [
 "DELVE",
 "DEMAND",
 "DEMEANOR",
-"DEMENTIA",
 "DEMISE",
 "DEMO",
 "DEMOCRACY",
@@ -2274,7 +2241,6 @@ const words = [
 "DIAMOND",
 "DIAPER",
 "DIAPHRAGM",
-"DIARRHEA",
 "DIARY",
 "DIASPORA",
 "DICE",
@@ -2773,7 +2739,6 @@ const words = [
 "ERASE",
 "ERICA",
 "EROSION",
-"EROTICA",
 "ERR",
 "ERRAND",
 "ERRATIC",
@@ -2906,8 +2871,6 @@ const words = [
 "EXTRA",
 "EXTRACT",
 "EXTREME",
-"EXTREMISM",
-"EXTREMIST",
 "EYE",
 "EYEBALL",
 "EYEBROW",
@@ -2963,8 +2926,6 @@ const words = [
 "FARMER",
 "FARMHOUSE",
 "FARMLAND",
-"FASCISM",
-"FASCIST",
 "FASHION",
 "FASTBALL",
 "FATALITY",
@@ -2972,7 +2933,6 @@ const words = [
 "FATEFUL",
 "FATHOM",
 "FATIGUE",
-"FATTY",
 "FAUCET",
 "FAULTY",
 "FAUNA",
@@ -2990,7 +2950,6 @@ const words = [
 "FEAT",
 "FEATURE",
 "FECAL",
-"FECES",
 "FEDERAL",
 "FEDORA",
 "FEE",
@@ -3309,6 +3268,7 @@ const words = [
 "FUEL",
 "FUGITIVE",
 "FUJI",
+"FULFILL",
 "FULL",
 "FULLBACK",
 "FULLNESS",
@@ -3416,7 +3376,6 @@ const words = [
 "GENITALIA",
 "GENITALS",
 "GENIUS",
-"GENOCIDE",
 "GENOME",
 "GENRE",
 "GENTILE",
@@ -3570,9 +3529,7 @@ const words = [
 "GRATE",
 "GRATEFUL",
 "GRATITUDE",
-"GRAVE",
 "GRAVEL",
-"GRAVEYARD",
 "GRAVITY",
 "GRAVY",
 "GRAY",
@@ -3649,7 +3606,6 @@ const words = [
 "GUNMAN",
 "GUNPOINT",
 "GUNPOWDER",
-"GUNSHOT",
 "GURNEY",
 "GURU",
 "GUST",
@@ -3695,7 +3651,6 @@ const words = [
 "HANDBALL",
 "HANDBOOK",
 "HANDFUL",
-"HANDGUN",
 "HANDHELD",
 "HANDICAP",
 "HANDLE",
@@ -3809,7 +3764,6 @@ const words = [
 "HEN",
 "HENRY",
 "HEPATIC",
-"HEPATITIS",
 "HERALD",
 "HERB",
 "HERBAL",
@@ -3829,7 +3783,6 @@ const words = [
 "HEX",
 "HEYDAY",
 "HIATUS",
-"HICKEY",
 "HICKORY",
 "HIDE",
 "HIDEOUS",
@@ -3880,7 +3833,6 @@ const words = [
 "HOLINESS",
 "HOLISTIC",
 "HOLLOW",
-"HOLOCAUST",
 "HOLOGRAM",
 "HOLSTER",
 "HOLY",
@@ -4018,7 +3970,6 @@ const words = [
 "IDENTIFY",
 "IDENTITY",
 "IDEOLOGY",
-"IDIOTIC",
 "IDLE",
 "IDOL",
 "IDYLLIC",
@@ -4230,6 +4181,7 @@ const words = [
 "INTERLUDE",
 "INTERN",
 "INTERNAL",
+"INTERNET",
 "INTERPLAY",
 "INTERPRET",
 "INTERRUPT",
@@ -4653,7 +4605,6 @@ const words = [
 "LINER",
 "LINEUP",
 "LINGER",
-"LINGERIE",
 "LINGO",
 "LINK",
 "LINKAGE",
@@ -4663,7 +4614,6 @@ const words = [
 "LIPSTICK",
 "LIQUID",
 "LIQUIDITY",
-"LIQUOR",
 "LIST",
 "LISTEN",
 "LISTENER",
@@ -4746,7 +4696,6 @@ const words = [
 "LOYALTY",
 "LUBRICANT",
 "LUCID",
-"LUCIFER",
 "LUCK",
 "LUCKY",
 "LUCRATIVE",
@@ -4814,7 +4763,6 @@ const words = [
 "MAGNETO",
 "MAGNITUDE",
 "MAGNOLIA",
-"MAGNUM",
 "MAHATMA",
 "MAIDEN",
 "MAIL",
@@ -4905,14 +4853,12 @@ const words = [
 "MARRIAGE",
 "MARROW",
 "MARRY",
-"MARSEILLE",
 "MARSH",
 "MARSHAL",
 "MART",
 "MARTIAL",
 "MARTIAN",
 "MARTIN",
-"MARTINI",
 "MARTYR",
 "MARVEL",
 "MARVELOUS",
@@ -4981,7 +4927,6 @@ const words = [
 "MEDIATION",
 "MEDIATOR",
 "MEDIC",
-"MEDICAID",
 "MEDICAL",
 "MEDICARE",
 "MEDICINAL",
@@ -5123,7 +5068,6 @@ const words = [
 "MISMATCH",
 "MISOGYNY",
 "MISS",
-"MISSILE",
 "MISSION",
 "MIST",
 "MISTAKE",
@@ -5482,8 +5426,6 @@ const words = [
 "OATMEAL",
 "OBEDIENCE",
 "OBEDIENT",
-"OBESE",
-"OBESITY",
 "OBEY",
 "OBI",
 "OBITUARY",
@@ -6103,7 +6045,6 @@ const words = [
 "POLE",
 "POLICEMAN",
 "POLICY",
-"POLIO",
 "POLITE",
 "POLITICAL",
 "POLITICO",
@@ -7071,7 +7012,6 @@ const words = [
 "SARI",
 "SASH",
 "SASSY",
-"SATANIC",
 "SATELLITE",
 "SATIN",
 "SATIRE",
@@ -7194,7 +7134,6 @@ const words = [
 "SEDENTARY",
 "SEDIMENT",
 "SEDITION",
-"SEDUCTION",
 "SEDUCTIVE",
 "SEE",
 "SEED",
@@ -7278,7 +7217,6 @@ const words = [
 "SEWAGE",
 "SEWER",
 "SEXTON",
-"SEXUALITY",
 "SHABBY",
 "SHACK",
 "SHADOW",
@@ -7357,7 +7295,6 @@ const words = [
 "SHORTHAND",
 "SHORTLIST",
 "SHORTSTOP",
-"SHOTGUN",
 "SHOULDER",
 "SHOVEL",
 "SHOW",
@@ -7878,7 +7815,6 @@ const words = [
 "STRINGENT",
 "STRINGER",
 "STRIPE",
-"STRIPPER",
 "STRIVE",
 "STROLL",
 "STROLLER",
@@ -7898,7 +7834,6 @@ const words = [
 "STUMP",
 "STUN",
 "STUNT",
-"STUPIDITY",
 "STURDY",
 "STURGEON",
 "STYLE",
@@ -8195,7 +8130,6 @@ const words = [
 "TENTATIVE",
 "TENUOUS",
 "TENURE",
-"TEQUILA",
 "TERM",
 "TERMINAL",
 "TERMINATE",
@@ -8547,7 +8481,6 @@ const words = [
 "TYRANNY",
 "TYRANT",
 "UKULELE",
-"ULCER",
 "ULSTER",
 "ULTIMATE",
 "ULTIMATUM",
@@ -8680,7 +8613,6 @@ const words = [
 "URGE",
 "URGENCY",
 "URGENT",
-"URINARY",
 "URN",
 "USABILITY",
 "USABLE",
@@ -8690,7 +8622,6 @@ const words = [
 "USELESS",
 "USER",
 "USUAL",
-"UTE",
 "UTERINE",
 "UTILITY",
 "UTILIZE",
@@ -8702,7 +8633,6 @@ const words = [
 "VACATION",
 "VACCINE",
 "VACUUM",
-"VAGINAL",
 "VAGUE",
 "VAIN",
 "VALE",
@@ -8727,7 +8657,6 @@ const words = [
 "VANITY",
 "VANTAGE",
 "VAPOR",
-"VAR",
 "VARIABLE",
 "VARIANCE",
 "VARIANT",
@@ -8828,7 +8757,6 @@ const words = [
 "VIOLINIST",
 "VIPER",
 "VIRAL",
-"VIRGINITY",
 "VIRTUAL",
 "VIRTUE",
 "VIRTUOUS",
@@ -8904,14 +8832,11 @@ const words = [
 "WANDERER",
 "WANNABE",
 "WANT",
-"WAR",
 "WARD",
 "WARDROBE",
 "WARE",
 "WAREHOUSE",
 "WARFARE",
-"WARHEAD",
-"WARLORD",
 "WARM",
 "WARMTH",
 "WARN",
@@ -9000,8 +8925,6 @@ const words = [
 "WHIPLASH",
 "WHIRLWIND",
 "WHISK",
-"WHISKEY",
-"WHISKY",
 "WHISPER",
 "WHISTLE",
 "WHISTLER",
@@ -9019,7 +8942,6 @@ const words = [
 "WIDOW",
 "WIDOWER",
 "WIDTH",
-"WIENER",
 "WIFE",
 "WIG",
 "WIGGLE",
@@ -9141,7 +9063,6 @@ const words = [
 "YUMMY",
 "ZEAL",
 "ZEBRA",
-"ZEE",
 "ZENITH",
 "ZEPPELIN",
 "ZEST",
@@ -0,0 +1,221 @@
+# analyze_puzzles.py
+
+# Measures how ambiguous puzzles are. Every clue number can be explained by
+# many (word, rule) pairs from the daily pool; the more pairs, the more
+# guesswork a clue needs. The tables below are built once from the pool and
+# hint_map.json, after which scoring a puzzle is a dictionary lookup.
+
+import argparse
+import json
+import math
+import os
+import time
+from itertools import permutations
+
+from run_daily_puzzle import input_file, history_dir
+
+hint_map_file = "qiyaas/data/hint_map.json"
+
+POS_NAMES = ["noun", "verb", "adjective"]
+RULES = ["length_rule", "alphabet_rule", "number_rule"]
+
+
+# --- NUMBER SEMANTICS ---
+def load_letter_numbers(filename=hint_map_file):
+    """
+    Read hint_map.json ("1": "= A , O", ...) into letter -> numbers tables.
+    The first letter is the alphabet rule, the second the number-word rule,
+    so T/F/S end up with two numbers each (Two/Three, Four/Five, Six/Seven).
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        hint_map = json.load(f)
+
+    alphabet, number_word = {}, {}
+    for num, hint in hint_map.items():
+        alpha_letter, number_letter = [part.strip() for part in hint.strip("= ").split(",")]
+        alphabet.setdefault(alpha_letter, []).append(int(num))
+        number_word.setdefault(number_letter, []).append(int(num))
+    return alphabet, number_word
+
+
+def numbers_for_word(word, rule, alphabet, number_word):
+    """Every number a player could read out of `word` under `rule`."""
+    if rule == "length_rule":
+        return [(len(word) % 9) or 9]
+    if rule == "alphabet_rule":
+        return alphabet.get(word[0].upper(), [])
+    return number_word.get(word[0].upper(), [])
+
+
+# --- CANDIDATE TABLES ---
+def build_candidate_table(words_by_pos, alphabet, number_word):
+    """
+    Count, for each POS and rule, how many words can produce each number.
+    Returns {pos: {rule: [count for numbers 0..9]}} (index 0 is unused).
+    """
+    table = {}
+    for pos in POS_NAMES:
+        table[pos] = {rule: [0] * 10 for rule in RULES}
+        for word in words_by_pos.get(pos, []):
+            if not 3 <= len(word) <= 9:
+                continue
+            for rule in RULES:
+                for num in numbers_for_word(word, rule, alphabet, number_word):
+                    table[pos][rule][num] += 1
+    return table
+
+
+def build_score_table(table):
+    """
+    Precompute the score of every ordered triple of clue numbers.
+
+    `interpretations` is the number of ways to read the three numbers as one
+    noun, one verb and one adjective under three different rules, which is
+    the size of the space a player has to search.
+    """
+    clue_candidates = [0] * 10
+    for num in range(1, 10):
+        clue_candidates[num] = sum(table[pos][rule][num] for pos in POS_NAMES for rule in RULES)
+
+    pos_orders = list(permutations(POS_NAMES))
+    rule_orders = list(permutations(RULES))
+
+    scores = {}
+    for triple in ((a, b, c) for a in range(1, 10) for b in range(1, 10) for c in range(1, 10)):
+        interpretations = 0
+        for pos_order in pos_orders:
+            for rule_order in rule_orders:
+                product = 1
+                for num, pos, rule in zip(triple, pos_order, rule_order):
+                    product *= table[pos][rule][num]
+                    if not product:
+                        break
+                interpretations += product
+        scores[triple] = {
+            "candidates": [clue_candidates[num] for num in triple],
+            "interpretations": interpretations,
+            "log10_interpretations": round(math.log10(interpretations), 3) if interpretations else None,
+            "distinct_numbers": len(set(triple)) == 3,
+        }
+    return scores
+
+
+def load_analyzer(words_file=input_file, hint_file=hint_map_file):
+    """Load the pool and hint map once and return the precomputed score table."""
+    with open(words_file, "r", encoding="utf-8") as f:
+        words_by_pos = json.load(f)
+    alphabet, number_word = load_letter_numbers(hint_file)
+    return build_score_table(build_candidate_table(words_by_pos, alphabet, number_word))
+
+
+# --- PUZZLE FORMATS ---
+def extract_puzzles(data, label=""):
+    """
+    Yield (label, numbers) for every puzzle found in `data`. Understands the
+    run_daily_puzzle.py format ({"date", "clues"}), the run_multiple_puzzles.py
+    format ({date: {round_n: {..., "numbers_for_clue"}}}) and lists of either.
+    """
+    if isinstance(data, list):
+        for i, item in enumerate(data):
+            yield from extract_puzzles(item, f"{label}[{i}]")
+    elif isinstance(data, dict):
+        if "clues" in data:
+            yield data.get("date", label), tuple(c["number"] for c in data["clues"])
+        elif "numbers_for_clue" in data:
+            yield label, tuple(data["numbers_for_clue"])
+        else:
+            for key, value in data.items():
+                yield from extract_puzzles(value, f"{label}/{key}" if label else key)
+
+
+def load_puzzle_files(paths):
+    """Read every puzzle JSON file in `paths`; directories are scanned for *.json."""
+    puzzles = []
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(".json"))
+        else:
+            files = [path]
+        for filename in files:
+            with open(filename, "r", encoding="utf-8") as f:
+                puzzles.extend(extract_puzzles(json.load(f)))
+    return puzzles
+
+
+# --- SCORING ---
+def interpretation_threshold(scores, percentile=10):
+    """
+    Interpretation count at `percentile` of all distinct-number triples. The
+    pool decides what "few" means, so the cut-off is read from the table
+    rather than fixed.
+    """
+    counts = sorted(s["interpretations"] for s in scores.values() if s["distinct_numbers"])
+    if not counts:
+        return 0
+    index = min(int(len(counts) * percentile / 100), len(counts) - 1)
+    return counts[index]
+
+
+def is_degenerate(numbers, scores, min_interpretations):
+    """
+    Cheap check a generator can run before accepting a puzzle. Get
+    `min_interpretations` once from interpretation_threshold().
+    """
+    score = scores.get(tuple(numbers))
+    if score is None:
+        return True
+    return not score["distinct_numbers"] or score["interpretations"] < min_interpretations
+
+
+def score_puzzles(puzzles, scores, min_interpretations=None):
+    """
+    Score (label, numbers) pairs against the precomputed table. Without
+    `min_interpretations`, the 10th percentile of the table is the cut-off.
+    """
+    if min_interpretations is None:
+        min_interpretations = interpretation_threshold(scores)
+    results = []
+    for label, numbers in puzzles:
+        score = scores.get(tuple(numbers))
+        if score is None:
+            results.append({"puzzle": label, "numbers": list(numbers), "degenerate": True, "error": "not three numbers in 1-9"})
+            continue
+        results.append({
+            "puzzle": label,
+            "numbers": list(numbers),
+            **score,
+            "degenerate": is_degenerate(numbers, scores, min_interpretations),
+        })
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score puzzle ambiguity in bulk.")
+    parser.add_argument("paths", nargs="*", default=[history_dir], help="puzzle JSON files or directories")
+    parser.add_argument("--percentile", type=float, default=10,
+                        help="puzzles below this percentile of all distinct-number triples are degenerate")
+    parser.add_argument("--min-interpretations", type=int, help="fixed cut-off instead of --percentile")
+    parser.add_argument("--output", help="write the full report to this JSON file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    scores = load_analyzer()
+    built = time.perf_counter()
+    threshold = args.min_interpretations
+    if threshold is None:
+        threshold = interpretation_threshold(scores, args.percentile)
+    puzzles = load_puzzle_files([p for p in args.paths if os.path.exists(p)])
+    results = score_puzzles(puzzles, scores, threshold)
+    done = time.perf_counter()
+
+    degenerate = [r for r in results if r["degenerate"]]
+    print(f"Built score table in {(built - start) * 1000:.1f} ms")
+    print(f"Scored {len(results)} puzzles in {(done - built) * 1000:.1f} ms")
+    print(f"Degenerate (fewer than {threshold} interpretations or a repeated number): {len(degenerate)}")
+    for r in degenerate:
+        print(f"  {r['puzzle']}: numbers={r['numbers']} interpretations={r.get('interpretations')}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nReport saved to: {args.output}")
@@ -0,0 +1,95 @@
+# cooldown.py
+
+# Word reuse after a cooldown, instead of retiring every used word forever.
+# A CooldownTracker stands in for the used-words set in run_daily_puzzle.py:
+# `word in tracker` is True while the word is still cooling down. A heap of
+# (reusable date, word) means moving to a new date only pops the words that
+# have expired -- O(log n) per word, and the history is never rescanned.
+#
+# used_words.json keeps its "used_words" list (the words still cooling
+# down, which is what the worker reads) and gains "last_used": {word: date}.
+# Words from older files have no date; they are treated as used on the first
+# date the tracker is moved to, so they get a full cooldown from then.
+
+import heapq
+import json
+import os
+from datetime import date, timedelta
+
+
+class CooldownTracker:
+    def __init__(self, cooldown_days=None):
+        """`cooldown_days` = None never lets a word back in (the old behaviour)."""
+        self.cooldown = timedelta(days=cooldown_days) if cooldown_days is not None else None
+        self.last_used = {}  # word -> date
+        self.undated = set()
+        self.cooling = set()
+        self.queue = []  # heap of (reusable date, word)
+        self.today = None
+
+    @classmethod
+    def load(cls, filename, cooldown_days=None):
+        tracker = cls(cooldown_days)
+        if os.path.exists(filename):
+            with open(filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for word, day in data.get("last_used", {}).items():
+                tracker._use(word, date.fromisoformat(day))
+            tracker.undated = set(data.get("used_words", [])) - set(tracker.last_used)
+            tracker.cooling |= tracker.undated
+        return tracker
+
+    def save(self, filename):
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump({
+                "used_words": sorted(self.cooling),
+                "last_used": {w: d.isoformat() for w, d in sorted(self.last_used.items())},
+            }, f, indent=2)
+
+    def __contains__(self, word):
+        return word in self.cooling
+
+    def __len__(self):
+        return len(self.cooling)
+
+    def __iter__(self):
+        return iter(self.cooling)
+
+    def _use(self, word, day):
+        self.last_used[word] = day
+        self.cooling.add(word)
+        if self.cooldown is not None:
+            heapq.heappush(self.queue, (day + self.cooldown, word))
+
+    def advance_to(self, day):
+        """
+        Make `day` the current date, letting words whose cooldown ran out be
+        used again. Going back to an earlier date rebuilds the queue from
+        last_used.
+        """
+        if self.today is not None and day < self.today:
+            self._rebuild()
+        self.today = day
+
+        for word in sorted(self.undated):
+            self._use(word, day)
+        self.undated.clear()
+
+        while self.queue and self.queue[0][0] <= day:
+            reusable, word = heapq.heappop(self.queue)
+            if self.last_used[word] + self.cooldown == reusable:  # skip entries from earlier uses
+                self.cooling.discard(word)
+
+    def _rebuild(self):
+        self.cooling = set(self.last_used)
+        self.queue = []
+        if self.cooldown is not None:
+            self.queue = [(day + self.cooldown, word) for word, day in self.last_used.items()]
+            heapq.heapify(self.queue)
+
+    def update(self, words):
+        """Mark `words` as used on the current date."""
+        if self.today is None:
+            raise ValueError("CooldownTracker.advance_to() must be called before update()")
+        for word in words:
+            self._use(word, self.today)
@@ -1,5 +1,10 @@
-import re
+from profiling import start_profiling
+
+profiler = start_profiling("extract_daily_words")
+profiler.phase("load")
+
 import json
+import os
 import nltk
 from better_profanity import profanity
 from wordfreq import zipf_frequency
@@ -8,15 +13,15 @@ from nltk.corpus import wordnet
 import spacy
 from collections import Counter
 from nltk.corpus import brown
-
-nlp = spacy.load("en_core_web_sm")  # or en_core_web_lg for better accuracy
+from lexicon import Lexicon, valid_words_lexicon
+from resources import require_nltk, spacy_model
+from rule_scheduler import Rule, Context, schedule, first_rejection, describe
+from pos_stats import load_dominant_pos, output_path as pos_stats_path
 
 # Setup
-for resource in ['averaged_perceptron_tagger', 'wordnet', 'omw-1.4', 'brown']:
-	try:
-		nltk.data.find(f'taggers/{resource}' if 'tagger' in resource else f'corpora/{resource}')
-	except LookupError:
-		nltk.download(resource)
+require_nltk('averaged_perceptron_tagger', 'wordnet', 'omw-1.4', 'brown')
+
+nlp = spacy.load(spacy_model("en_core_web_sm"))  # or en_core_web_lg for better accuracy
 
 profanity.load_censor_words()
 lemmatizer = WordNetLemmatizer()
@@ -81,29 +86,34 @@ def get_pos_for_lemmatizer(tag):
 	return wordnet.NOUN
 
 # Add this near the top, after your setup code
-print("Building POS lookup from Brown corpus...")
-brown_pos_lookup = {}
-for w, tag in brown.tagged_words():
-    w_lower = w.lower()
-    if w_lower not in brown_pos_lookup:
-        brown_pos_lookup[w_lower] = []
-    brown_pos_lookup[w_lower].append(tag)
-
-# Convert to dominant POS
-brown_dominant_pos = {}
-for word, tags in brown_pos_lookup.items():
-    tag_counts = Counter(tags)
-    most_common_tag = tag_counts.most_common(1)[0][0]
+# Statistics from pos_stats.py (large tagged corpora) replace Brown when present
+if os.path.exists(pos_stats_path):
+    print(f"Loading POS lookup from {pos_stats_path}...")
+    brown_dominant_pos = load_dominant_pos(pos_stats_path)
+else:
+    print("Building POS lookup from Brown corpus...")
+    brown_pos_lookup = {}
+    for w, tag in brown.tagged_words():
+        w_lower = w.lower()
+        if w_lower not in brown_pos_lookup:
+            brown_pos_lookup[w_lower] = []
+        brown_pos_lookup[w_lower].append(tag)
+
+    # Convert to dominant POS
+    brown_dominant_pos = {}
+    for word, tags in brown_pos_lookup.items():
+        tag_counts = Counter(tags)
+        most_common_tag = tag_counts.most_common(1)[0][0]
     
-    if most_common_tag.startswith('NN'):
-        brown_dominant_pos[word] = 'noun'
-    elif most_common_tag.startswith('VB'):
-        brown_dominant_pos[word] = 'verb'
-    elif most_common_tag.startswith('JJ'):
-        brown_dominant_pos[word] = 'adjective'
-    elif most_common_tag.startswith('RB'):
-        brown_dominant_pos[word] = 'adverb'
-print("Done building lookup!")
+        if most_common_tag.startswith('NN'):
+            brown_dominant_pos[word] = 'noun'
+        elif most_common_tag.startswith('VB'):
+            brown_dominant_pos[word] = 'verb'
+        elif most_common_tag.startswith('JJ'):
+            brown_dominant_pos[word] = 'adjective'
+        elif most_common_tag.startswith('RB'):
+            brown_dominant_pos[word] = 'adverb'
+    print("Done building lookup!")
 
 # Then replace your function with a simple lookup:
 def get_dominant_pos_from_corpus(word):
@@ -160,9 +170,6 @@ def get_dominant_pos_ensemble(word):
     vote_counts = Counter(votes)
     return vote_counts.most_common(1)[0][0]
 
-# Then just use this in your main loop:
-dominant = get_dominant_pos_ensemble(w)
-
 def is_plural_or_inflected(word_lower):
 	"""Check if a word is a plural or inflected form"""
 	# Try lemmatizing as both noun and verb
@@ -176,16 +183,15 @@ def is_plural_or_inflected(word_lower):
 	
 	return False
 
-input_path = "qiyaas/data/wordsList.js"
+input_path = valid_words_lexicon
 output_json_path = "qiyaas/data/intmed/daily_words_tagged.json"
 output_txt_path = "qiyaas/data/intmed/daily_words_list.txt"
 profanity_output_path = "qiyaas/data/intmed/profanity.txt"
+zipf_output_path = "qiyaas/data/intmed/daily_words_zipf.json"
 
-with open(input_path, "r", encoding="utf-8") as f:
-	text = f.read()
-
-all_words = re.findall(r'"([A-Za-z]+)"', text)
+all_words = Lexicon.load(input_path).words()
 
+profiler.phase("classify")
 tagged_words = nltk.pos_tag([w.lower() for w in all_words])  # lowercase here
 
 words_by_pos = {
@@ -197,59 +203,82 @@ words_by_pos = {
 # Track profanity words
 profanity_words = set()
 
-for word, tag in tagged_words:
-	w = word.lower()
+# Zipf frequency of every kept word, used for weighted sampling
+zipf_scores = {}
+
+def dominant_pos(ctx):
+	"""Dominant part of speech, falling back to the tagger's tag"""
+	w, tag = ctx['word'], ctx.item[1]
+	dominant = get_dominant_pos_ensemble(w)
+	if not dominant:
+		if tag.startswith('N'):
+			dominant = 'noun'
+		elif tag.startswith('V'):
+			dominant = 'verb'
+		elif tag.startswith('J'):
+			dominant = 'adjective'
+	return dominant
+
+# Values shared between rules, computed at most once per word
+derive = {
+	'word': lambda ctx: ctx.item[0].lower(),
+	'zipf': lambda ctx: zipf_frequency(ctx['word'], "en"),
+	'dominant': dominant_pos,
+}
+
+# Each rule returns True when the word must be dropped. The scheduler runs
+# the cheapest, most selective rules first within each group. Profanity is
+# recorded for every word that survives the first group, so it stays after
+# that group and everything after it stays after profanity.
+FIRST_GROUP = ['inflected', 'ing', 'adverb', 'past_tense', 'blocklist']
 
+rules = [
 	# skip inflections
-	if is_plural_or_inflected(w):
-		continue
+	Rule('inflected', lambda ctx: is_plural_or_inflected(ctx['word']), cost=10),
 
 	# skip if ends with 'ing' (gerunds/present participles)
-	if w.endswith('ing'):
-		continue
+	Rule('ing', lambda ctx: ctx['word'].endswith('ing'), cost=0.1),
 
 	# Skip adverbs (RB, RBR, RBS tags)
-	if tag.startswith('RB'):
-		continue
+	Rule('adverb', lambda ctx: ctx.item[1].startswith('RB'), cost=0.1),
 
 	# skip past tense verbs (VBD) and past participles (VBN)
-	if tag in ('VBD', 'VBN'):
-		continue
-	
+	Rule('past_tense', lambda ctx: ctx.item[1] in ('VBD', 'VBN'), cost=0.1),
+
 	# skip blocklist; directional words; and number words
-	if w in BLOCKLIST or w in DIRECTIONAL or w in NUMBER_WORDS:
-		continue
+	Rule('blocklist', lambda ctx: ctx['word'] in BLOCKLIST or ctx['word'] in DIRECTIONAL or ctx['word'] in NUMBER_WORDS, cost=0.1),
+
+	# Check profanity
+	Rule('profanity', lambda ctx: profanity.contains_profanity(ctx['word']), cost=20, after=FIRST_GROUP),
+
+	# Check frequency
+	Rule('frequency', lambda ctx: not ctx['zipf'] > 3.0, cost=5, after=['profanity']),
+
+	# Only include words between 3-9 letters
+	Rule('length', lambda ctx: not 3 <= len(ctx['word']) <= 9, cost=0.1, after=['profanity']),
+
+	# Only include nouns, verbs, and adjectives
+	Rule('pos', lambda ctx: ctx['dominant'] not in ['noun', 'verb', 'adjective'], cost=50, after=['profanity']),
+]
+
+ordered_rules = schedule(rules, tagged_words, derive)
+print("Rule order:")
+print(describe(ordered_rules))
+
+for item in tagged_words:
+	ctx = Context(item, derive)
+	rejected_by = first_rejection(ordered_rules, ctx)
 
-	# Check profanity and frequency
-	has_profanity = profanity.contains_profanity(w)
-	has_sufficient_frequency = zipf_frequency(w, "en") > 3.0
-	
 	# Track profanity words
-	if has_profanity:
-		profanity_words.add(w)
-	
-	if not has_profanity and has_sufficient_frequency:
-		word_len = len(w)
-	
-		# Only include words between 3-9 letters
-		if 3 <= word_len <= 9:
-			# Get dominant part of speech
-			dominant = get_dominant_pos_ensemble(w)
-			if not dominant:
-				if tag.startswith('N'):
-					dominant = 'noun'
-				elif tag.startswith('V'):
-					dominant = 'verb'
-				elif tag.startswith('J'):
-					dominant = 'adjective'
-				else:
-					continue
-	
-			# Only include nouns, verbs, and adjectives
-			if dominant in ['noun', 'verb', 'adjective']:
-				words_by_pos[dominant].append(w)
+	if rejected_by == 'profanity':
+		profanity_words.add(ctx['word'])
+
+	if rejected_by is None:
+		words_by_pos[ctx['dominant']].append(ctx['word'])
+		zipf_scores[ctx['word'].upper()] = ctx['zipf']
 
 # ---- PREPARE UPPERCASE VERSION FOR SAVING ----
+profiler.phase("write")
 words_by_pos_upper = {
     pos: sorted({w.upper() for w in words_by_pos[pos]})
     for pos in words_by_pos
@@ -266,6 +295,10 @@ with open(output_txt_path, "w", encoding="utf-8") as f:
 	for w in all_words_flat:
 		f.write(w + "\n")
 
+# ---- SAVE ZIPF SCORES (UPPERCASE) ----
+with open(zipf_output_path, "w", encoding="utf-8") as f:
+	json.dump(dict(sorted(zipf_scores.items())), f, indent=2)
+
 # ---- SAVE PROFANITY (UPPERCASE) ----
 with open(profanity_output_path, "w", encoding="utf-8") as f:
 	for w in sorted(profanity_words):
@@ -279,4 +312,7 @@ print(f"  Total unique: {len(all_words_flat)}")
 print(f"  Profanity flagged: {len(profanity_words)}")
 print(f"\nJSON output saved to: {output_json_path}")
 print(f"Text output saved to: {output_txt_path}")
-print(f"Profanity words saved to: {profanity_output_path}")
\ No newline at end of file
+print(f"Profanity words saved to: {profanity_output_path}")
+print(f"Zipf scores saved to: {zipf_output_path}")
+
+profiler.finish()
@@ -1,18 +1,21 @@
-import nltk
-from nltk import pos_tag
+from profiling import start_profiling
+
+profiler = start_profiling("extract_valid_words")
+profiler.phase("load")
+
 from nltk.corpus import wordnet, names
 from nltk.stem import WordNetLemmatizer
 from geotext import GeoText
 from countryinfo import CountryInfo
 import pycountry
 import enchant
+from resources import require_nltk
+from rule_scheduler import Rule, Context, schedule, first_rejection, describe
 
 # -------------------------------------------------------------------
 # LOAD NLTK RESOURCES
 # -------------------------------------------------------------------
-nltk.download('wordnet')
-nltk.download('averaged_perceptron_tagger')
-nltk.download('names')
+require_nltk('wordnet', 'names')
 
 # -------------------------------------------------------------------
 # LOAD ENCHANT DICTIONARIES
@@ -153,42 +156,50 @@ output_path = 'qiyaas/data/intmed/valid_words_list.txt'
 with open(input_path, 'r', encoding='utf-8') as f:
     raw_words = [w.strip() for w in f.read().split()]
 
-filtered = set()
-
-for raw in raw_words:
-    surface = raw.lower()
-    singular = normalize(surface)
+# Each rule returns True when the word must be dropped. The scheduler
+# measures them on a sample and runs the cheapest, most selective first;
+# the result does not depend on the order.
+derive = {
+    'surface': lambda ctx: ctx.item.lower(),
+    'singular': lambda ctx: normalize(ctx['surface']),
+}
 
+rules = [
     # FORCE REMOVE CHECK
-    if surface in FORCE_REMOVE:
-        continue
+    Rule('force_remove', lambda ctx: ctx['surface'] in FORCE_REMOVE, cost=0.1),
 
     # RULE 1: Length must be between 3-9 characters
-    if len(surface) < 3 or len(surface) > 9:
-        continue
+    Rule('length', lambda ctx: len(ctx['surface']) < 3 or len(ctx['surface']) > 9, cost=0.1),
 
     # RULE 2: Must exist in WordNet
-    if not wordnet.synsets(singular):
-        continue
+    Rule('wordnet', lambda ctx: not wordnet.synsets(ctx['singular']), cost=5),
 
     # RULE 3: Remove demonyms & countries
-    if singular in country_names or singular in country_demonyms:
-        continue
+    Rule('country', lambda ctx: ctx['singular'] in country_names or ctx['singular'] in country_demonyms, cost=2),
 
     # RULE 4: Remove pure human names
-    if is_pure_person_name(singular):
-        continue
+    Rule('pure_name', lambda ctx: is_pure_person_name(ctx['singular']), cost=2),
 
-    # RULE 5: Remove British spellings
-    if is_british(singular) or is_british(surface):
-        continue
+    # RULE 5: Remove British spellings (checked once when the word is already singular)
+    Rule('british', lambda ctx: is_british(ctx['singular'])
+         or (ctx['surface'] != ctx['singular'] and is_british(ctx['surface'])), cost=20),
 
     # RULE 6: Remove proper nouns that are places
-    if is_proper_noun_to_remove(raw):
-        continue
+    Rule('proper_place', lambda ctx: is_proper_noun_to_remove(ctx.item), cost=20),
+]
 
-    # Passed all tests → keep original surface form
-    filtered.add(surface)
+profiler.phase("classify")
+ordered_rules = schedule(rules, raw_words, derive)
+print("Rule order:")
+print(describe(ordered_rules))
+
+filtered = set()
+
+for raw in raw_words:
+    ctx = Context(raw, derive)
+    if first_rejection(ordered_rules, ctx) is None:
+        # Passed all tests → keep original surface form
+        filtered.add(ctx['surface'])
 
 # ADD FORCED WORDS (only if they meet length requirement)
 for word in FORCE_ADD:
@@ -198,10 +209,13 @@ for word in FORCE_ADD:
 # -------------------------------------------------------------------
 # SAVE OUTPUT
 # -------------------------------------------------------------------
+profiler.phase("write")
 filtered_sorted = sorted(filtered)
 
 with open(output_path, 'w', encoding='utf-8') as f:
     for w in filtered_sorted:
         f.write(w + '\n')
 
-print("Total words kept:", len(filtered_sorted))
\ No newline at end of file
+print("Total words kept:", len(filtered_sorted))
+
+profiler.finish()
@@ -0,0 +1,436 @@
+# kv_upload.py
+
+# Bulk-loads the worker's KV namespace from the Python outputs:
+#
+#   daily_words_tagged    qiyaas/data/intmed/daily_words_tagged.json
+#   used_words            qiyaas/data/used_words.json
+#   current_puzzle        qiyaas/data/daily_words.json
+#   puzzle_<date>         qiyaas/data/puzzles/puzzle_<date>.json
+#
+# The frontend reads {date, clues} puzzles from current_puzzle and
+# puzzle_<date>, so only files in that format (run_daily_puzzle.py) are
+# uploaded to them. A run_multiple_puzzles.py file left in daily_words.json
+# is skipped, and so is a current_puzzle whose date is neither the newest
+# history date nor today in America/New_York, so a stale local file never
+# replaces the live puzzle.
+#
+# Keys go up in batches through Cloudflare's bulk write endpoint, over at
+# most --connections keep-alive connections. Failed batches are retried with
+# exponential backoff (honouring Retry-After). Every uploaded key is recorded
+# with a hash of its value, so an interrupted run picks up where it stopped
+# and unchanged keys are never sent twice.
+#
+# Usage:
+#   python qiyaas/utils/kv_upload.py upload --account <id> --namespace <id>    (token in CLOUDFLARE_API_TOKEN)
+#   python qiyaas/utils/kv_upload.py stub --port 8788 --fail-rate 0.2
+#   python qiyaas/utils/kv_upload.py upload --api-url http://127.0.0.1:8788 --account a --namespace n
+
+import argparse
+import asyncio
+import email.utils
+import hashlib
+import json
+import os
+import random
+import re
+import ssl
+import sys
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+from zoneinfo import ZoneInfo
+
+from puzzle_dates import DEFAULT_TIMEZONE
+from run_daily_puzzle import input_file, used_words_file, output_file, history_dir
+from serve_puzzles import build_response, read_request, read_response
+
+API_URL = "https://api.cloudflare.com"
+BULK_PATH = "/client/v4/accounts/{account}/storage/kv/namespaces/{namespace}/bulk"
+progress_file = "qiyaas/data/kv_upload_progress.json"
+
+# Cloudflare's limits for one bulk write, and for one value
+MAX_BATCH_KEYS = 10000
+MAX_BATCH_BYTES = 100 * 1024 * 1024
+MAX_VALUE_BYTES = 25 * 1024 * 1024
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+# --- COLLECTING KEYS ---
+def is_daily_puzzle(text):
+    """True for a run_daily_puzzle.py puzzle ({"date", "clues"})."""
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return False
+    return isinstance(data, dict) and "date" in data and "clues" in data
+
+
+def collect_items(current_file=output_file, history=history_dir, today=None):
+    """
+    [(key, value)] for every KV key the worker reads, from the local files.
+    `today` defaults to the current date in DEFAULT_TIMEZONE.
+    """
+    if today is None:
+        today = datetime.now(ZoneInfo(DEFAULT_TIMEZONE)).date()
+
+    items = []
+    for key, path in (("daily_words_tagged", input_file), ("used_words", used_words_file)):
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                items.append((key, f.read()))
+
+    puzzles = [("current_puzzle", current_file)]
+    history_dates = []
+    if os.path.isdir(history):
+        for name in sorted(os.listdir(history)):
+            match = re.match(r"^(puzzle_(\d{4}-\d{2}-\d{2}))\.json$", name)
+            if match:
+                puzzles.append((match.group(1), os.path.join(history, name)))
+                history_dates.append(match.group(2))
+    live_dates = {today.isoformat(), *history_dates[-1:]}
+
+    for key, path in puzzles:
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        if not is_daily_puzzle(text):
+            print(f"Skipping {path}: not a {{date, clues}} puzzle, so it cannot go to {key}")
+            continue
+        puzzle_date = json.loads(text)["date"]
+        if key == "current_puzzle" and puzzle_date not in live_dates:
+            print(f"Skipping {path}: its date {puzzle_date} is neither today ({today.isoformat()}) "
+                  f"nor the newest history date, so it cannot go to {key}")
+            continue
+        items.append((key, text))
+    return items
+
+
+def value_hash(value):
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+def make_batches(items, max_keys=1000, max_bytes=MAX_BATCH_BYTES // 2):
+    """Split [(key, value)] into batches within both the key and byte limits."""
+    batches, batch, size = [], [], 0
+    for key, value in items:
+        item_bytes = len(key) + len(value.encode())
+        if batch and (len(batch) >= max_keys or size + item_bytes > max_bytes):
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append((key, value))
+        size += item_bytes
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+# --- PROGRESS ---
+class Progress:
+    """{namespace: {key: value hash}} of keys already uploaded, saved after every batch."""
+
+    def __init__(self, filename, namespace):
+        self.filename = filename
+        self.namespace = namespace
+        self.data = {}
+        if os.path.exists(filename):
+            with open(filename, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+        self.uploaded = self.data.setdefault(namespace, {})
+
+    def pending(self, items):
+        return [(key, value) for key, value in items if self.uploaded.get(key) != value_hash(value)]
+
+    def record(self, batch):
+        for key, value in batch:
+            self.uploaded[key] = value_hash(value)
+        tmp = self.filename + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.filename)
+
+
+# --- UPLOADER ---
+class RetryableError(Exception):
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (seconds or an HTTP date), or None."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class BulkUploader:
+    def __init__(self, api_url, account, namespace, token, connections=8, retries=6, backoff=0.5, max_backoff=30.0, timeout=60.0):
+        parts = urlsplit(api_url)
+        self.host = parts.hostname
+        self.tls = parts.scheme == "https"
+        self.port = parts.port or (443 if self.tls else 80)
+        self.path = BULK_PATH.format(account=account, namespace=namespace)
+        self.token = token
+        self.connections = connections
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.sent = 0
+        self.attempts = 0
+        self.retried = 0
+
+    async def _connect(self):
+        context = ssl.create_default_context() if self.tls else None
+        return await asyncio.open_connection(self.host, self.port, ssl=context)
+
+    async def _put(self, conn, batch):
+        reader, writer = conn
+        body = json.dumps([{"key": key, "value": value} for key, value in batch]).encode()
+        head = (
+            f"PUT {self.path} HTTP/1.1\r\n"
+            f"Host: {self.host}\r\n"
+            f"Authorization: Bearer {self.token}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        )
+        writer.write(head.encode() + body)
+        await writer.drain()
+        status, headers, response = await asyncio.wait_for(read_response(reader), self.timeout)
+
+        if status in RETRY_STATUSES:
+            retry_after = headers.get("retry-after")
+            raise RetryableError(f"HTTP {status}", parse_retry_after(retry_after))
+        try:
+            result = json.loads(response)
+        except ValueError:
+            result = {}
+        if status != 200 or not result.get("success"):
+            raise RuntimeError(f"HTTP {status}: {result.get('errors') or response[:200]!r}")
+        rejected = set((result.get("result") or {}).get("unsuccessful_keys") or [])
+        return headers.get("connection", "").lower() != "close", rejected
+
+    async def send(self, conn, batch):
+        """
+        Upload one batch, retrying with backoff. Returns the (possibly new)
+        connection and the keys the API reported as unsuccessful; if the
+        batch fails, the connection is closed before the error is raised.
+        """
+        for attempt in range(self.retries + 1):
+            self.attempts += 1
+            try:
+                if conn is None:
+                    conn = await self._connect()
+                keep_alive, rejected = await self._put(conn, batch)
+                if not keep_alive:
+                    conn[1].close()
+                    conn = None
+                self.sent += len(batch) - len(rejected)
+                return conn, rejected
+            except (RetryableError, ConnectionError, OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                if conn is not None and (attempt == self.retries or not isinstance(e, RetryableError)):
+                    conn[1].close()
+                    conn = None
+                if attempt == self.retries:
+                    raise
+                self.retried += 1
+                delay = min(self.backoff * 2 ** attempt, self.max_backoff) * random.uniform(0.5, 1.0)
+                if isinstance(e, RetryableError) and e.retry_after is not None:
+                    delay = max(delay, e.retry_after)
+                await asyncio.sleep(delay)
+            except Exception:
+                # Not worth retrying (e.g. a 4xx): the caller drops the connection, so close it here
+                if conn is not None:
+                    conn[1].close()
+                raise
+
+    async def upload(self, batches, progress):
+        """
+        Upload `batches` concurrently, recording the keys of each finished
+        batch that were stored. Returns the keys that were not.
+        """
+        queue = asyncio.Queue()
+        for batch in batches:
+            queue.put_nowait(batch)
+        failed = []
+
+        async def worker():
+            conn = None
+            try:
+                while not queue.empty():
+                    batch = queue.get_nowait()
+                    try:
+                        conn, rejected = await self.send(conn, batch)
+                    except (RuntimeError, RetryableError, OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                        print(f"Batch of {len(batch)} keys starting at {batch[0][0]} failed: {e}")
+                        failed.extend(key for key, _ in batch)
+                        conn = None
+                        continue
+                    if rejected:
+                        print(f"Rejected by the API: {', '.join(sorted(rejected))}")
+                        failed.extend(sorted(rejected))
+                    progress.record([(key, value) for key, value in batch if key not in rejected])
+            finally:
+                if conn is not None:
+                    conn[1].close()
+
+        await asyncio.gather(*(worker() for _ in range(min(self.connections, len(batches)) or 1)))
+        return failed
+
+
+# --- LOCAL STUB OF THE BULK API ---
+class KVStub:
+    """In-memory stand-in for the bulk write endpoint, with optional injected failures."""
+
+    def __init__(self, fail_rate=0.0, latency_ms=0, seed=0, max_value_bytes=MAX_VALUE_BYTES):
+        self.values = {}
+        self.fail_rate = fail_rate
+        self.max_value_bytes = max_value_bytes
+        self.latency = latency_ms / 1000
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.failures = 0
+
+    def route(self, method, path, body):
+        match = re.match(r"^/client/v4/accounts/[^/]+/storage/kv/namespaces/([^/]+)/(bulk|values/(.+))$", path)
+        if not match:
+            return 404, {"success": False, "errors": [{"message": "Not Found"}]}
+        namespace = self.values.setdefault(match.group(1), {})
+
+        if match.group(3) is not None and method == "GET":
+            value = namespace.get(match.group(3))
+            if value is None:
+                return 404, {"success": False, "errors": [{"message": "key not found"}]}
+            return 200, value
+        if match.group(2) != "bulk" or method != "PUT":
+            return 405, {"success": False, "errors": [{"message": "Method Not Allowed"}]}
+
+        self.requests += 1
+        if self.rng.random() < self.fail_rate:
+            self.failures += 1
+            return self.rng.choice([429, 503]), {"success": False, "errors": [{"message": "injected failure"}]}
+        if len(body) > MAX_BATCH_BYTES:
+            return 413, {"success": False, "errors": [{"message": "payload too large"}]}
+        pairs = json.loads(body)
+        if len(pairs) > MAX_BATCH_KEYS:
+            return 400, {"success": False, "errors": [{"message": f"more than {MAX_BATCH_KEYS} keys"}]}
+        # Like the real API, oversized values fail one by one without failing the request
+        unsuccessful = []
+        for pair in pairs:
+            if len(pair["value"].encode()) > self.max_value_bytes:
+                unsuccessful.append(pair["key"])
+            else:
+                namespace[pair["key"]] = pair["value"]
+        return 200, {"success": True, "errors": [], "messages": [],
+                     "result": {"successful_key_count": len(pairs) - len(unsuccessful),
+                                "unsuccessful_keys": unsuccessful}}
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except ValueError:
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                status, result = self.route(method, urlsplit(target).path, body)
+                payload = result.encode() if isinstance(result, str) else json.dumps(result).encode()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                extra = {"Retry-After": "0.1"} if status == 429 else None
+                writer.write(build_response(status, payload, extra, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run_stub(host, port, stub):
+    listener = await asyncio.start_server(stub.handle, host, port)
+    print(f"KV bulk API stub on http://{host}:{port} (fail rate {stub.fail_rate:.0%})")
+    async with listener:
+        await listener.serve_forever()
+
+
+def upload(args):
+    token = args.token or os.environ.get("CLOUDFLARE_API_TOKEN", "")
+    if not token and args.api_url == API_URL:
+        sys.exit("Set CLOUDFLARE_API_TOKEN or pass --token")
+
+    items = collect_items()
+    progress = Progress(args.progress, args.namespace)
+    if args.force:
+        progress.uploaded.clear()
+    pending = progress.pending(items)
+    batches = make_batches(pending, min(args.batch_size, MAX_BATCH_KEYS))
+    print(f"{len(items)} keys, {len(items) - len(pending)} already uploaded, {len(pending)} to send in {len(batches)} batches")
+    if not batches:
+        return 0
+
+    uploader = BulkUploader(args.api_url, args.account, args.namespace, token,
+                            connections=args.connections, retries=args.retries, backoff=args.backoff)
+    start = time.perf_counter()
+    failed = asyncio.run(uploader.upload(batches, progress))
+    elapsed = time.perf_counter() - start
+
+    print(f"Uploaded {uploader.sent} keys in {elapsed:.2f} s "
+          f"({uploader.attempts} requests, {uploader.retried} retries)")
+    print(f"Progress saved to: {args.progress}")
+    if failed:
+        print(f"{len(failed)} keys failed; run again to retry them")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-load the worker's KV namespace.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    upload_cmd = commands.add_parser("upload", help="upload puzzle history and word data")
+    upload_cmd.add_argument("--account", default=os.environ.get("CLOUDFLARE_ACCOUNT_ID"), required="CLOUDFLARE_ACCOUNT_ID" not in os.environ)
+    upload_cmd.add_argument("--namespace", required=True, help="KV namespace id (see cloudflare-worker/wrangler.toml)")
+    upload_cmd.add_argument("--token", help="API token (default: CLOUDFLARE_API_TOKEN)")
+    upload_cmd.add_argument("--api-url", default=API_URL, help="point at a stub for testing")
+    upload_cmd.add_argument("--connections", type=int, default=8)
+    upload_cmd.add_argument("--batch-size", type=int, default=1000)
+    upload_cmd.add_argument("--retries", type=int, default=6)
+    upload_cmd.add_argument("--backoff", type=float, default=0.5, help="first retry delay in seconds, doubled each time")
+    upload_cmd.add_argument("--progress", default=progress_file)
+    upload_cmd.add_argument("--force", action="store_true", help="ignore saved progress and upload every key")
+
+    stub_cmd = commands.add_parser("stub", help="run a local stub of the KV bulk API")
+    stub_cmd.add_argument("--host", default="127.0.0.1")
+    stub_cmd.add_argument("--port", type=int, default=8788)
+    stub_cmd.add_argument("--fail-rate", type=float, default=0.0, help="share of bulk writes answered with 429/503")
+    stub_cmd.add_argument("--latency-ms", type=float, default=0)
+    stub_cmd.add_argument("--max-value-bytes", type=int, default=MAX_VALUE_BYTES, help="larger values are reported as unsuccessful keys")
+
+    args = parser.parse_args()
+
+    if args.command == "upload":
+        sys.exit(upload(args))
+    else:
+        stub = KVStub(args.fail_rate, args.latency_ms, max_value_bytes=args.max_value_bytes)
+        try:
+            asyncio.run(run_stub(args.host, args.port, stub))
+        except KeyboardInterrupt:
+            print(f"\n{stub.requests} bulk writes ({stub.failures} failed), "
+                  f"{sum(len(v) for v in stub.values.values())} keys stored")
@@ -0,0 +1,104 @@
+# lexicon.py
+
+# Canonical word-list artifact shared by every Python stage. quote_words.py
+# builds it from the .txt intermediates and derives the JS word lists from
+# it, so the scripts no longer have to regex the generated JS back apart.
+#
+# File layout (.lex, little-endian):
+#   magic      4 bytes  b"QLEX"
+#   version    u16
+#   max_length u16      longest word length L
+#   offsets    (L + 2) x u32, byte offset of the block of words of each
+#              length 0..L, plus the end of the data
+#   data       uppercase ASCII words sorted by (length, word), no separators;
+#              every word in a block has the block's length, so word i of
+#              length n is data[offsets[n] + i * n : offsets[n] + (i + 1) * n]
+
+import struct
+from bisect import bisect_left
+
+valid_words_lexicon = "qiyaas/data/lexicon/valid_words.lex"
+daily_words_lexicon = "qiyaas/data/lexicon/daily_words.lex"
+
+MAGIC = b"QLEX"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+
+
+def write_lexicon(path, words):
+    """Sort, deduplicate and uppercase `words` and write them to `path`."""
+    unique = sorted({w.strip().upper() for w in words if w.strip()}, key=lambda w: (len(w), w))
+    for word in unique:
+        if not (word.isascii() and word.isalpha()):
+            raise ValueError(f"Lexicon words must be ASCII letters only: {word!r}")
+
+    max_length = len(unique[-1]) if unique else 0
+    offsets = [0] * (max_length + 2)
+    for word in unique:
+        offsets[len(word) + 1] += len(word)
+    for n in range(1, max_length + 2):
+        offsets[n] += offsets[n - 1]
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, max_length))
+        f.write(struct.pack(f"<{max_length + 2}I", *offsets))
+        f.write("".join(unique).encode("ascii"))
+    return len(unique)
+
+
+class Lexicon:
+    def __init__(self, data):
+        magic, version, max_length = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a lexicon file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported lexicon version {version} (expected {VERSION})")
+        self.max_length = max_length
+        self.offsets = struct.unpack_from(f"<{max_length + 2}I", data, HEADER.size)
+        self.data = memoryview(data)[HEADER.size + 4 * (max_length + 2):]
+        self._blocks = {}
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def lengths(self):
+        return [n for n in range(1, self.max_length + 1) if self.offsets[n + 1] > self.offsets[n]]
+
+    def count(self, length):
+        if not 1 <= length <= self.max_length:
+            return 0
+        return (self.offsets[length + 1] - self.offsets[length]) // length
+
+    def by_length(self, length):
+        """Words of `length`, alphabetical."""
+        if length not in self._blocks:
+            if not 1 <= length <= self.max_length:
+                return []
+            block = bytes(self.data[self.offsets[length]:self.offsets[length + 1]]).decode("ascii")
+            self._blocks[length] = [block[i:i + length] for i in range(0, len(block), length)]
+        return self._blocks[length]
+
+    def words(self):
+        """Every word, alphabetical (the order the JS lists use)."""
+        return sorted(w for n in self.lengths() for w in self.by_length(n))
+
+    def __len__(self):
+        return sum(self.count(n) for n in self.lengths())
+
+    def __contains__(self, word):
+        word = word.upper()
+        block = self.by_length(len(word))
+        i = bisect_left(block, word)
+        return i < len(block) and block[i] == word
+
+
+def write_js(path, lexicon):
+    """Write the JS word list the frontend imports, derived from the lexicon."""
+    with open(path, "w", encoding="utf-8") as outfile:
+        outfile.write("const words = [ \n")
+        for word in lexicon.words():
+            outfile.write(f'"{word}",\n')
+        outfile.write("]; \n \n")
+        outfile.write("export default words;")
@@ -0,0 +1,144 @@
+# pattern_index.py
+
+# Hangman-style lookups: given a word length, the letters revealed so far and
+# the letters guessed wrong, list every word that still fits.
+#
+# For each (length, position, letter) the index keeps a bitmap (a Python int)
+# with bit i set when word i of that length has that letter there, plus one
+# "contains letter" bitmap per (length, letter). A query is a handful of
+# bitwise ANDs over those ints instead of a regex scan over the whole list.
+#
+# Usage:
+#   python qiyaas/utils/pattern_index.py A__LE --exclude RST
+#   python qiyaas/utils/pattern_index.py _O_E --daily
+
+import argparse
+import time
+
+from lexicon import Lexicon, valid_words_lexicon, daily_words_lexicon
+
+words_file = valid_words_lexicon
+daily_words_file = daily_words_lexicon
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LETTER_INDEX = {letter: i for i, letter in enumerate(ALPHABET)}
+HIDDEN = "_.?"
+
+
+def load_words(filename):
+    return Lexicon.load(filename).words()
+
+
+def iter_bits(mask):
+    """Yield the index of every set bit in `mask`, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class PatternIndex:
+    def __init__(self, words):
+        self.words = {}      # length -> words, bit i of a bitmap is words[length][i]
+        self.at = {}         # length -> [position][letter] -> bitmap
+        self.contains = {}   # length -> [letter] -> bitmap
+        self.full = {}       # length -> bitmap with every word set
+
+        for word in sorted(set(w.upper() for w in words)):
+            if not word.isalpha() or not word.isascii():
+                continue
+            length = len(word)
+            if length not in self.words:
+                self.words[length] = []
+                self.at[length] = [[0] * 26 for _ in range(length)]
+                self.contains[length] = [0] * 26
+            bit = 1 << len(self.words[length])
+            self.words[length].append(word)
+            for pos, letter in enumerate(word):
+                i = LETTER_INDEX[letter]
+                self.at[length][pos][i] |= bit
+                self.contains[length][i] |= bit
+
+        for length, group in self.words.items():
+            self.full[length] = (1 << len(group)) - 1
+
+    @classmethod
+    def from_file(cls, filename=words_file):
+        return cls(load_words(filename))
+
+    def mask(self, length, known=None, excluded="", hangman=True):
+        """
+        Bitmap of the words of `length` that fit. `known` maps position ->
+        revealed letter; `excluded` holds letters guessed wrong. With
+        `hangman` a revealed letter is revealed everywhere it occurs, so it
+        cannot also sit at a position that is still hidden. Characters other
+        than A-Z in `excluded` (separators like "R,S") are ignored.
+        """
+        known = {pos: letter.upper() for pos, letter in (known or {}).items()}
+        for pos, letter in known.items():
+            if not 0 <= pos < length:
+                raise ValueError(f"Position {pos} is outside a {length}-letter word")
+            if letter not in LETTER_INDEX:
+                raise ValueError(f"Revealed letter {letter!r} at position {pos} is not A-Z")
+        if length not in self.full:
+            return 0
+        at = self.at[length]
+        contains = self.contains[length]
+
+        result = self.full[length]
+        for pos, letter in known.items():
+            result &= at[pos][LETTER_INDEX[letter]]
+            if not result:
+                return 0
+        for letter in (set(excluded.upper()) & set(ALPHABET)) - set(known.values()):
+            result &= ~contains[LETTER_INDEX[letter]]
+
+        if hangman and known:
+            revealed = {LETTER_INDEX[l] for l in known.values()}
+            for pos in range(length):
+                if pos not in known:
+                    for i in revealed:
+                        result &= ~at[pos][i]
+        return result
+
+    def query(self, length, known=None, excluded="", hangman=True):
+        """Words of `length` that fit, in alphabetical order."""
+        group = self.words.get(length, [])
+        return [group[i] for i in iter_bits(self.mask(length, known, excluded, hangman))]
+
+    def count(self, length, known=None, excluded="", hangman=True):
+        return self.mask(length, known, excluded, hangman).bit_count()
+
+    def match(self, pattern, excluded="", hangman=True):
+        """Query with a pattern like "A__LE" ('_', '.' or '?' for hidden letters)."""
+        known = {}
+        for pos, ch in enumerate(pattern.upper()):
+            if ch in HIDDEN:
+                continue
+            if ch not in LETTER_INDEX:
+                raise ValueError(f"Pattern {pattern!r} has {ch!r} at position {pos}; use A-Z or {HIDDEN} for hidden letters")
+            known[pos] = ch
+        return self.query(len(pattern), known, excluded, hangman)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find words matching a partially revealed pattern.")
+    parser.add_argument("pattern", help="e.g. A__LE, with _ for hidden letters")
+    parser.add_argument("--exclude", default="", help="letters already guessed wrong")
+    parser.add_argument("--daily", action="store_true", help="search the daily word pool instead of all valid words")
+    parser.add_argument("--no-hangman", action="store_true", help="allow revealed letters at hidden positions")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = PatternIndex.from_file(daily_words_file if args.daily else words_file)
+    built = time.perf_counter()
+    try:
+        matches = index.match(args.pattern, args.exclude, hangman=not args.no_hangman)
+    except ValueError as e:
+        parser.error(str(e))
+    done = time.perf_counter()
+
+    print(f"Built index in {(built - start) * 1000:.1f} ms, query took {(done - built) * 1_000_000:.0f} us")
+    print(f"{len(matches)} matches:")
+    for word in matches:
+        print(f"  {word}")
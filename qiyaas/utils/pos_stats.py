@@ -0,0 +1,174 @@
+# pos_stats.py
+
+# Builds per-word part-of-speech counts from large tagged corpora (CoNLL-U /
+# Universal Dependencies dumps, or any whitespace-separated column format)
+# as a drop-in replacement for the Brown lookup in extract_daily_words.py.
+#
+# Files are split into byte ranges on line boundaries; worker processes
+# count (word, POS) pairs in their range and the counts are summed. Only
+# words from the valid-words lexicon are counted, so memory stays bounded by
+# the lexicon size however large the corpora are.
+#
+# Usage:
+#   python qiyaas/utils/pos_stats.py en_ewt-ud-train.conllu big_dump.conllu --workers 8
+#   python qiyaas/utils/pos_stats.py corpus.txt --form-col 0 --tag-col 1
+
+import argparse
+import json
+import os
+import time
+from multiprocessing import Pool
+
+from lexicon import Lexicon, valid_words_lexicon
+
+output_path = "qiyaas/data/intmed/pos_stats.json"
+
+POS_CLASSES = ["noun", "verb", "adjective", "adverb", "other"]
+NOUN, VERB, ADJECTIVE, ADVERB, OTHER = range(len(POS_CLASSES))
+
+# Universal POS tags. Like the Brown lookup, proper nouns and auxiliaries do
+# not count as nouns/verbs (Brown tags them NP and BE/HV/DO).
+UPOS_CLASSES = {"NOUN": NOUN, "VERB": VERB, "ADJ": ADJECTIVE, "ADV": ADVERB}
+UPOS_TAGS = {"ADJ", "ADP", "ADV", "AUX", "CCONJ", "DET", "INTJ", "NOUN", "NUM",
+             "PART", "PRON", "PROPN", "PUNCT", "SCONJ", "SYM", "VERB", "X"}
+
+FORMATS = {
+    # name: (form column, tag column), 0-based
+    "conllu": (1, 3),
+    "columns": (0, 1),
+}
+
+
+def tag_class(tag):
+    """Coarse class of a UPOS or Penn/Brown-style tag."""
+    if tag in UPOS_TAGS:
+        return UPOS_CLASSES.get(tag, OTHER)
+    if tag.startswith("NNP"):  # proper nouns (NNP, NNPS) are not puzzle nouns, same as UPOS PROPN
+        return OTHER
+    if tag.startswith("NN"):
+        return NOUN
+    if tag.startswith("VB"):
+        return VERB
+    if tag.startswith("JJ"):
+        return ADJECTIVE
+    if tag.startswith("RB"):
+        return ADVERB
+    return OTHER
+
+
+# --- MAP ---
+_vocabulary = None
+
+
+def _init_worker(vocabulary):
+    global _vocabulary
+    _vocabulary = vocabulary
+
+
+def count_chunk(task):
+    """Count (word, class) pairs for the lines starting inside [start, end) of a file."""
+    path, start, end, form_col, tag_col = task
+    counts = {}
+    tokens = 0
+    with open(path, "rb") as f:
+        f.seek(start)
+        if start:
+            f.readline()  # the previous chunk owns the line we landed in
+        while f.tell() <= end:
+            line = f.readline()
+            if not line:
+                break
+            if line.startswith(b"#"):
+                continue
+            fields = line.split(b"\t") if b"\t" in line else line.split()
+            if len(fields) <= max(form_col, tag_col):
+                continue
+            if form_col == 1 and (b"-" in fields[0] or b"." in fields[0]):
+                continue  # CoNLL-U multiword tokens and empty nodes
+            word = fields[form_col].decode("utf-8", "replace").lower()
+            tokens += 1
+            if _vocabulary is not None and word not in _vocabulary:
+                continue
+            row = counts.get(word)
+            if row is None:
+                row = counts[word] = [0] * len(POS_CLASSES)
+            row[tag_class(fields[tag_col].decode("ascii", "replace").strip())] += 1
+    return counts, tokens
+
+
+def split_files(paths, chunk_bytes):
+    """Byte ranges of roughly `chunk_bytes` covering every file."""
+    chunks = []
+    for path in paths:
+        size = os.path.getsize(path)
+        for start in range(0, max(size, 1), chunk_bytes):
+            chunks.append((path, start, min(start + chunk_bytes, size)))
+    return chunks
+
+
+# --- REDUCE ---
+def build_pos_stats(paths, form_col, tag_col, vocabulary=None, workers=None, chunk_mb=64):
+    """Return ({word: [count per POS class]}, tokens read)."""
+    tasks = [(path, start, end, form_col, tag_col) for path, start, end in split_files(paths, chunk_mb << 20)]
+    totals = {}
+    tokens = 0
+    with Pool(workers, initializer=_init_worker, initargs=(vocabulary,)) as pool:
+        for counts, chunk_tokens in pool.imap_unordered(count_chunk, tasks):
+            tokens += chunk_tokens
+            for word, row in counts.items():
+                total = totals.get(word)
+                if total is None:
+                    totals[word] = row
+                else:
+                    for i, n in enumerate(row):
+                        total[i] += n
+    return totals, tokens
+
+
+def load_dominant_pos(filename=output_path):
+    """
+    {word: 'noun' | 'verb' | 'adjective' | 'adverb'} by most frequent class,
+    the same shape as brown_dominant_pos in extract_daily_words.py.
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        stats = json.load(f)
+    dominant = {}
+    for word, row in stats["counts"].items():
+        best = max(range(len(row)), key=lambda i: row[i])
+        if best != OTHER:
+            dominant[word] = POS_CLASSES[best]
+    return dominant
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build POS statistics from tagged corpora.")
+    parser.add_argument("paths", nargs="+", help="tagged corpus files")
+    parser.add_argument("--format", choices=FORMATS, default="conllu")
+    parser.add_argument("--form-col", type=int, help="0-based column of the word (overrides --format)")
+    parser.add_argument("--tag-col", type=int, help="0-based column of the tag (overrides --format)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-mb", type=int, default=64)
+    parser.add_argument("--all-words", action="store_true", help="count every word, not just lexicon words")
+    parser.add_argument("--output", default=output_path)
+    args = parser.parse_args()
+
+    form_col, tag_col = FORMATS[args.format]
+    form_col = args.form_col if args.form_col is not None else form_col
+    tag_col = args.tag_col if args.tag_col is not None else tag_col
+    vocabulary = None if args.all_words else {w.lower() for w in Lexicon.load(valid_words_lexicon).words()}
+
+    start = time.perf_counter()
+    counts, tokens = build_pos_stats(args.paths, form_col, tag_col, vocabulary, args.workers, args.chunk_mb)
+    elapsed = time.perf_counter() - start
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": 1,
+            "classes": POS_CLASSES,
+            "sources": [os.path.basename(p) for p in args.paths],
+            "tokens": tokens,
+            "counts": dict(sorted(counts.items())),
+        }, f, separators=(",", ":"))
+
+    print(f"Counted {tokens} tokens, {len(counts)} words in {elapsed:.1f} s")
+    print(f"POS statistics saved to: {args.output}")
@@ -0,0 +1,110 @@
+# profiling.py
+
+# Shared --profile switch for the scripts in this folder. A script calls
+# start_profiling() at the top, marks its phases with profiler.phase(...)
+# and calls profiler.finish() at the end. Without --profile every call is a
+# no-op, so the scripts behave exactly as before.
+#
+# Each run is written to qiyaas/data/profiles/<script>-<timestamp>/:
+#   profile.json    phases, top cProfile functions and top allocations
+#   cprofile.pstats raw stats for pstats / snakeviz
+
+import cProfile
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+profiles_dir = "qiyaas/data/profiles"
+
+PROFILE_FORMAT_VERSION = 1
+
+
+class Profiler:
+    def __init__(self, script_name, top_n=25, output_dir=profiles_dir):
+        self.script_name = script_name
+        self.top_n = top_n
+        self.output_dir = output_dir
+        self.started_at = datetime.now()
+        self.phases = []
+        self._current = None
+        self._profile = cProfile.Profile()
+
+        tracemalloc.start()
+        self._profile.enable()
+
+    def phase(self, name):
+        """End the running phase (if any) and start timing `name`."""
+        now = time.perf_counter()
+        if self._current is not None:
+            self.phases.append({"name": self._current[0], "seconds": round(now - self._current[1], 6)})
+        self._current = (name, now) if name else None
+
+    def finish(self):
+        """Stop profiling and write the results. Returns the run directory."""
+        self.phase(None)
+        self._profile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        run_dir = os.path.join(self.output_dir, f"{self.script_name}-{self.started_at.strftime('%Y%m%d-%H%M%S')}")
+        os.makedirs(run_dir, exist_ok=True)
+        self._profile.dump_stats(os.path.join(run_dir, "cprofile.pstats"))
+
+        stats = pstats.Stats(self._profile)
+        functions = []
+        for (filename, lineno, funcname), (cc, nc, tt, ct, _) in stats.stats.items():
+            functions.append({
+                "function": f"{filename}:{lineno}({funcname})",
+                "primitive_calls": cc,
+                "calls": nc,
+                "tottime": round(tt, 6),
+                "cumtime": round(ct, 6),
+            })
+        functions.sort(key=lambda f: f["cumtime"], reverse=True)
+
+        allocations = []
+        for stat in snapshot.statistics("lineno")[:self.top_n]:
+            frame = stat.traceback[0]
+            allocations.append({
+                "location": f"{frame.filename}:{frame.lineno}",
+                "size_bytes": stat.size,
+                "count": stat.count,
+            })
+
+        report = {
+            "version": PROFILE_FORMAT_VERSION,
+            "script": self.script_name,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "argv": sys.argv,
+            "phases": self.phases,
+            "total_seconds": round(sum(p["seconds"] for p in self.phases), 6),
+            "cprofile_top": functions[:self.top_n],
+            "tracemalloc_top": allocations,
+            "memory_current_bytes": current,
+            "memory_peak_bytes": peak,
+        }
+        with open(os.path.join(run_dir, "profile.json"), "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+        print(f"\nProfile saved to: {run_dir}")
+        return run_dir
+
+
+class NullProfiler:
+    def phase(self, name):
+        pass
+
+    def finish(self):
+        return None
+
+
+def start_profiling(script_name, enabled=None):
+    """Return a running Profiler when --profile was passed, else a no-op one."""
+    if enabled is None:
+        enabled = "--profile" in sys.argv
+    return Profiler(script_name) if enabled else NullProfiler()
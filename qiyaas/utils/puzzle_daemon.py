@@ -0,0 +1,259 @@
+# puzzle_daemon.py
+
+# Long-lived puzzle generator for practice mode. Importing the generators
+# (WordNet classification in run_multiple_puzzles.py, the tagged word lists
+# and used-word state for run_daily_puzzle.py) takes seconds; the daemon
+# pays that once and then answers each request in well under a millisecond.
+#
+#   GET  /round?seed=N                one practice round (random seed if omitted)
+#   GET  /rounds/YYYY-MM-DD?count=N   that date's rounds (N up to 1000), same as run_multiple_puzzles.py
+#   GET  /daily/YYYY-MM-DD            that date's daily puzzle from history (read-only)
+#   POST /daily/YYYY-MM-DD            generate and save it if it does not exist yet,
+#                                     like run_daily_puzzle.py --timezones
+#   POST /batch                       JSON list of {"op": "round" | "rounds" | "daily", ...};
+#                                     "daily" generates only with "generate": true
+#   GET  /metrics                     per-op latency histograms (JSON)
+#
+# Generating a daily puzzle uses up words for good, so it is never a side
+# effect of a GET. The used-word state is re-read from used_words.json right
+# before each generation, so updates made by the CLI or cron in the meantime
+# are kept rather than overwritten.
+#
+# Every response carries a Server-Timing header with the generation time;
+# batch results carry their own "elapsed_us". Errors come back as
+# {"error": ...} with status 400 for bad input and 500 otherwise, like the
+# worker.
+#
+# Usage:
+#   python qiyaas/utils/puzzle_daemon.py --port 8790
+#   python qiyaas/utils/puzzle_daemon.py --unix /tmp/qiyaas.sock --cooldown-days 730
+
+import argparse
+import asyncio
+import contextlib
+import inspect
+import io
+import json
+import random
+import time
+from datetime import date
+from urllib.parse import urlsplit, parse_qs
+
+from profiling import start_profiling
+from serve_puzzles import DATE_PATTERN, LatencyHistogram, build_response, error_body, read_request
+
+MAX_ROUNDS = 1000  # per /rounds request, so one request cannot tie up the event loop
+
+
+class BadRequest(Exception):
+    pass
+
+
+class PuzzleNotFound(Exception):
+    pass
+
+
+class PuzzleDaemon:
+    def __init__(self, cooldown_days=None):
+        start = time.perf_counter()
+        import run_daily_puzzle as daily
+        import run_multiple_puzzles as practice
+        from cooldown import CooldownTracker
+
+        self.daily = daily
+        self.practice = practice
+        self.tracker_class = CooldownTracker
+        self.cooldown_days = cooldown_days
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.word_classes = daily.load_word_classes()
+        self.rng = random.Random()
+        self.latency = {op: LatencyHistogram() for op in self.ops()}
+        self.started = time.time()
+        self.load_seconds = time.perf_counter() - start
+
+    def ops(self):
+        return {"round": self.round, "rounds": self.rounds, "daily": self.daily_puzzle}
+
+    # --- GENERATORS ---
+    def round(self, seed=None):
+        seed = self.rng.getrandbits(32) if seed is None else as_int(seed, "seed")
+        puzzle = self.practice.get_daily_puzzle(random_seed=seed)
+        return {"seed": seed, **self.practice.to_round(puzzle)}
+
+    def rounds(self, date=None, count=20):
+        count = as_int(count, "count")
+        if not 1 <= count <= MAX_ROUNDS:
+            raise BadRequest(f"count must be between 1 and {MAX_ROUNDS}")
+        return self.practice.build_rounds(parse_date(date), count)
+
+    def daily_puzzle(self, date=None, generate=False):
+        puzzle_date = parse_date(date)
+        puzzle = self.daily.load_puzzle_history(puzzle_date)
+        if puzzle is None:
+            if not generate:
+                raise PuzzleNotFound(f"No puzzle for {puzzle_date.isoformat()}")
+            # Fresh copy of the used words, so changes from other processes survive the save
+            used_words = self.tracker_class.load(self.daily.used_words_file, self.cooldown_days)
+            with contextlib.redirect_stdout(io.StringIO()):
+                puzzle = self.daily.get_daily_puzzle(used_words, puzzle_date, force_regenerate=True,
+                                                     word_classes=self.word_classes)
+            self.daily.save_puzzle_history(puzzle)
+        return puzzle
+
+    def run(self, op, params):
+        """Return (result, seconds) for one request; raises BadRequest for bad input."""
+        handler = self.ops().get(op)
+        if handler is None:
+            raise BadRequest(f"unknown op: {op}")
+        try:
+            inspect.signature(handler).bind(**params)
+        except TypeError as e:
+            raise BadRequest(f"{op}: {e}")
+        start = time.perf_counter()
+        result = handler(**params)
+        elapsed = time.perf_counter() - start
+        self.latency[op].record(elapsed)
+        return result, elapsed
+
+    def batch(self, requests):
+        results = []
+        for request in requests:
+            params = {k: v for k, v in request.items() if k != "op"}
+            try:
+                result, elapsed = self.run(request.get("op"), params)
+                results.append({"ok": True, "result": result, "elapsed_us": round(elapsed * 1e6, 1)})
+            except Exception as e:  # one bad request must not sink the rest of the batch
+                results.append({"ok": False, "error": str(e)})
+        return results
+
+    def metrics(self):
+        return {
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "load_seconds": round(self.load_seconds, 3),
+            "latency": {op: histogram.summary() for op, histogram in self.latency.items()},
+        }
+
+    # --- HTTP ---
+    def route(self, method, target, body):
+        """Return (status, body, extra headers) for one request."""
+        parts = urlsplit(target)
+        path = parts.path
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+
+        if path == "/metrics" and method == "GET":
+            return 200, json.dumps(self.metrics()).encode(), None
+
+        if path == "/batch":
+            if method != "POST":
+                return 405, error_body("Method Not Allowed"), None
+            try:
+                requests = json.loads(body)
+            except ValueError:
+                return 400, error_body("Body must be a JSON list of requests"), None
+            if not isinstance(requests, list) or not all(isinstance(r, dict) for r in requests):
+                return 400, error_body("Body must be a JSON list of requests"), None
+            start = time.perf_counter()
+            results = self.batch(requests)
+            return 200, json.dumps(results).encode(), server_timing(time.perf_counter() - start)
+
+        op, _, arg = path.strip("/").partition("/")
+        if method == "POST" and op == "daily" and arg:
+            params = {"date": arg, "generate": True}
+        elif method != "GET":
+            return 405, error_body("Method Not Allowed"), None
+        elif op == "round" and not arg:
+            params = {"seed": query["seed"]} if "seed" in query else {}
+        elif op == "rounds" and arg:
+            params = {"date": arg, "count": query.get("count", 20)}
+        elif op == "daily" and arg:
+            params = {"date": arg}
+        else:
+            return 404, error_body("Not Found"), None
+
+        try:
+            result, elapsed = self.run(op, params)
+        except PuzzleNotFound as e:
+            return 404, error_body(str(e)), None
+        except BadRequest as e:
+            return 400, error_body(str(e)), None
+        return 200, json.dumps(result).encode(), server_timing(elapsed)
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except ValueError:
+                    writer.write(build_response(400, error_body("Bad Request"), keep_alive=False))
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    status, payload, extra = self.route(method, target, body)
+                except Exception as e:
+                    status, payload, extra = 500, error_body(str(e) or type(e).__name__), None
+                writer.write(build_response(status, payload, extra, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def parse_date(value):
+    if value is None:
+        return date.today()
+    try:
+        if DATE_PATTERN.match(str(value)):
+            return date.fromisoformat(value)
+    except ValueError:
+        pass
+    raise BadRequest("Invalid date format. Use YYYY-MM-DD")
+
+
+def as_int(value, name):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise BadRequest(f"{name} must be an integer")
+
+
+def server_timing(seconds):
+    return {"Server-Timing": f"gen;dur={seconds * 1000:.3f}"}
+
+
+async def serve(daemon, host, port, unix=None):
+    if unix:
+        listener = await asyncio.start_unix_server(daemon.handle, unix)
+        where = f"unix:{unix}"
+    else:
+        listener = await asyncio.start_server(daemon.handle, host, port)
+        where = f"http://{host}:{port}"
+    print(f"Warm in {daemon.load_seconds:.2f} s, serving puzzles on {where}")
+    async with listener:
+        await listener.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep the puzzle generators warm and serve them locally.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8790)
+    parser.add_argument("--unix", help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--cooldown-days", type=int, help="used-word cooldown for daily puzzles (default: never reuse)")
+    parser.add_argument("--profile", action="store_true", help="profile startup")
+    args = parser.parse_args()
+
+    profiler = start_profiling("puzzle_daemon", enabled=args.profile)
+    profiler.phase("load")
+    daemon = PuzzleDaemon(args.cooldown_days)
+    profiler.phase(None)
+    profiler.finish()
+
+    try:
+        asyncio.run(serve(daemon, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print("\n" + json.dumps(daemon.metrics()["latency"], indent=2))
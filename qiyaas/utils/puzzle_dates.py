@@ -0,0 +1,31 @@
+# puzzle_dates.py
+
+# Which puzzle dates are "live" for a set of time zones. A player sees the
+# puzzle for their local date, so over the next `window_hours` every local
+# date reached in any of the zones needs a puzzle. Zones that share a date
+# share the puzzle, so the result is deduplicated.
+
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+DEFAULT_TIMEZONE = "America/New_York"
+
+
+def live_puzzle_dates(timezones, now=None, window_hours=48):
+    """
+    Return {date: [time zones]} for every local date that occurs in any of
+    `timezones` between `now` and `now + window_hours`, sorted by date.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    end = now + timedelta(hours=window_hours)
+
+    live = {}
+    for name in timezones:
+        zone = ZoneInfo(name)
+        day = now.astimezone(zone).date()
+        last = end.astimezone(zone).date()
+        while day <= last:
+            live.setdefault(day, []).append(name)
+            day += timedelta(days=1)
+    return dict(sorted(live.items()))
@@ -1,21 +1,33 @@
 # quote_words.py
 
-# This script takes a plain text word list (one word per line)
-# and outputs a version where each word is wrapped in double quotes.
+# This script takes a plain text word list (one word per line), saves it as
+# the canonical lexicon artifact (see lexicon.py) and derives the JS version,
+# where each word is wrapped in double quotes, from that artifact.
+
+import os
+
+from profiling import start_profiling
+from lexicon import Lexicon, write_lexicon, write_js, valid_words_lexicon, daily_words_lexicon
+
+profiler = start_profiling("quote_words")
 
 input_path = 'qiyaas/data/intmed/valid_words_list.txt' # your existing output file
+lexicon_path = valid_words_lexicon  # canonical artifact read by the Python scripts
 output_path = 'qiyaas/data/wordsList.js'  # new file with quotes
 
 # input_path = 'qiyaas/data/intmed/daily_words_list.txt' # your existing output file
+# lexicon_path = daily_words_lexicon  # canonical artifact read by the Python scripts
 # output_path = 'qiyaas/data/dailywordsList.js'  # new file with quotes
 
+profiler.phase("load")
 with open(input_path, 'r', encoding='utf-8') as infile:
     words = [line.strip() for line in infile if line.strip()]
 
-with open(output_path, 'w', encoding='utf-8') as outfile:
-    outfile.write("const words = [ \n")
-    for word in words:
-        outfile.write(f'"{word.upper()}",\n')
-    outfile.write("]; \n \n")
-    outfile.write("export default words;")
+profiler.phase("write")
+os.makedirs(os.path.dirname(lexicon_path), exist_ok=True)
+count = write_lexicon(lexicon_path, words)
+write_js(output_path, Lexicon.load(lexicon_path))
+
+print(f"Saved {count} words to {lexicon_path} and {output_path}")
 
+profiler.finish()
@@ -0,0 +1,205 @@
+# resources.py
+
+# Offline bundle for the NLTK corpora and the spaCy model the scripts need.
+#
+#   python qiyaas/utils/resources.py fetch    download everything into the bundle
+#                                             and write MANIFEST.json with checksums
+#   python qiyaas/utils/resources.py verify   re-hash the bundle against the manifest
+#
+# Once the bundle exists the scripts resolve every resource from it: NLTK's
+# search path is pointed at the bundle only and nothing is downloaded or
+# probed over the network. Without a bundle they fall back to the old
+# find-or-download behaviour, unless QIYAAS_OFFLINE=1 is set, in which case a
+# missing bundle is an error instead of a download.
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from datetime import datetime
+
+bundle_dir = "qiyaas/data/vendor"
+nltk_dir = os.path.join(bundle_dir, "nltk_data")
+spacy_dir = os.path.join(bundle_dir, "spacy")
+manifest_path = os.path.join(bundle_dir, "MANIFEST.json")
+
+# Package name -> path nltk.data.find() looks up
+NLTK_RESOURCES = {
+    "wordnet": "corpora/wordnet",
+    "omw-1.4": "corpora/omw-1.4",
+    "brown": "corpora/brown",
+    "names": "corpora/names",
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+    "averaged_perceptron_tagger_eng": "taggers/averaged_perceptron_tagger_eng",  # NLTK >= 3.9
+}
+# pos_tag loads one of these, depending on the NLTK version
+TAGGERS = ("averaged_perceptron_tagger", "averaged_perceptron_tagger_eng")
+
+SPACY_MODELS = ["en_core_web_sm"]
+
+MANIFEST_VERSION = 1
+
+
+def offline():
+    return os.environ.get("QIYAAS_OFFLINE") == "1"
+
+
+def load_manifest():
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# --- RESOLVING ---
+def tagger_package():
+    """The perceptron tagger pos_tag needs in the installed NLTK (3.9 renamed it)."""
+    import nltk
+
+    version = tuple(int(part) for part in re.findall(r"\d+", nltk.__version__)[:2])
+    return "averaged_perceptron_tagger_eng" if version >= (3, 9) else "averaged_perceptron_tagger"
+
+
+def resolve_packages(packages):
+    """`packages` with any tagger replaced by the one the installed NLTK loads."""
+    resolved = [p for p in packages if p not in TAGGERS]
+    if any(p in TAGGERS for p in packages):
+        resolved.append(tagger_package())
+    return resolved
+
+
+def require_nltk(*packages):
+    """Make sure the NLTK `packages` can be loaded, from the bundle when there is one."""
+    import nltk
+
+    packages = resolve_packages(packages)
+    manifest = load_manifest()
+    if manifest is not None:
+        nltk.data.path[:] = [os.path.abspath(nltk_dir)]
+        missing = [p for p in packages if p not in manifest["nltk"]]
+        if missing:
+            raise LookupError(f"NLTK resources missing from {bundle_dir}: {missing} "
+                              f"(NLTK {nltk.__version__}). Run resources.py fetch.")
+        return
+
+    if offline():
+        raise LookupError(f"QIYAAS_OFFLINE=1 but there is no resource bundle at {bundle_dir}. Run resources.py fetch.")
+
+    for package in packages:
+        try:
+            nltk.data.find(NLTK_RESOURCES[package])
+        except LookupError:
+            nltk.download(package)
+
+
+def spacy_model(name):
+    """Path of the bundled spaCy model, or the package name when there is no bundle."""
+    manifest = load_manifest()
+    if manifest is not None:
+        if name not in manifest["spacy"]:
+            raise LookupError(f"spaCy model {name} missing from {bundle_dir}. Run resources.py fetch.")
+        return os.path.join(spacy_dir, name)
+    if offline():
+        raise LookupError(f"QIYAAS_OFFLINE=1 but there is no resource bundle at {bundle_dir}. Run resources.py fetch.")
+    return name
+
+
+# --- CHECKSUMS ---
+def hash_tree(root):
+    """{relative path: sha256} for every file under `root`."""
+    hashes = {}
+    for folder, _, files in os.walk(root):
+        for name in sorted(files):
+            path = os.path.join(folder, name)
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            hashes[os.path.relpath(path, bundle_dir)] = digest.hexdigest()
+    return hashes
+
+
+def resource_files(hashes, prefix):
+    return {path: h for path, h in hashes.items() if path.startswith(prefix + os.sep) or path.startswith(prefix + ".")}
+
+
+# --- FETCH / VERIFY ---
+def fetch():
+    import nltk
+    import spacy
+
+    os.makedirs(nltk_dir, exist_ok=True)
+    os.makedirs(spacy_dir, exist_ok=True)
+
+    # Both taggers are bundled when available; only the one this NLTK loads is required
+    optional = set(TAGGERS) - {tagger_package()}
+    fetched = []
+    for package in NLTK_RESOURCES:
+        ok = nltk.download(package, download_dir=nltk_dir, raise_on_error=package not in optional)
+        if ok:
+            fetched.append(package)
+
+    for name in SPACY_MODELS:
+        target = os.path.join(spacy_dir, name)
+        if os.path.exists(target):
+            shutil.rmtree(target)
+        spacy.load(name).to_disk(target)
+
+    hashes = hash_tree(nltk_dir)
+    hashes.update(hash_tree(spacy_dir))
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "nltk_version": nltk.__version__,
+        "spacy_version": spacy.__version__,
+        "nltk": {p: resource_files(hashes, os.path.join("nltk_data", NLTK_RESOURCES[p])) for p in fetched},
+        "spacy": {name: resource_files(hashes, os.path.join("spacy", name)) for name in SPACY_MODELS},
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    print(f"Bundled {len(fetched)} NLTK packages and {len(SPACY_MODELS)} spaCy models ({len(hashes)} files)")
+    print(f"Manifest saved to: {manifest_path}")
+
+
+def verify():
+    """Return a list of problems with the bundle; empty when it matches the manifest."""
+    manifest = load_manifest()
+    if manifest is None:
+        return [f"no manifest at {manifest_path}"]
+
+    expected = {}
+    for group in ("nltk", "spacy"):
+        for files in manifest[group].values():
+            expected.update(files)
+    actual = hash_tree(nltk_dir)
+    actual.update(hash_tree(spacy_dir))
+
+    problems = []
+    for path, digest in sorted(expected.items()):
+        if path not in actual:
+            problems.append(f"missing: {path}")
+        elif actual[path] != digest:
+            problems.append(f"checksum mismatch: {path}")
+    for path in sorted(set(actual) - set(expected)):
+        problems.append(f"unexpected file: {path}")
+    return problems
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the offline NLTK/spaCy resource bundle.")
+    parser.add_argument("command", choices=["fetch", "verify"])
+    args = parser.parse_args()
+
+    if args.command == "fetch":
+        fetch()
+    else:
+        problems = verify()
+        for problem in problems:
+            print(problem)
+        if problems:
+            sys.exit(1)
+        print(f"Bundle at {bundle_dir} matches {manifest_path}")
@@ -1,18 +1,38 @@
 import random
 from datetime import date
+import argparse
 import json
 import os
 
+from cooldown import CooldownTracker
+from profiling import start_profiling
+from puzzle_dates import live_puzzle_dates, DEFAULT_TIMEZONE
+from weighted_sampling import build_sampler
+from word_difficulty import load_word_difficulty
+
 input_file = "qiyaas/data/intmed/daily_words_tagged.json"
 used_words_file = "qiyaas/data/used_words.json"
 output_file = "qiyaas/data/daily_words.json"
+history_dir = "qiyaas/data/puzzles"  # one puzzle_<date>.json per day, like the worker's KV keys
 
 # --- WORD CLASSIFICATION (reads JSON with POS tags) ---
-def load_word_classes(filename=input_file):
-    """Load words organized by their actual POS tags"""
+def load_word_classes(filename=input_file, difficulty_range=None):
+    """
+    Load words organized by their actual POS tags.
+    difficulty_range=(low, high) keeps only words whose word_difficulty.py
+    score falls inside the range.
+    """
     with open(filename, "r", encoding="utf-8") as f:
         words_by_pos = json.load(f)
     
+    if difficulty_range is not None:
+        low, high = difficulty_range
+        difficulty = load_word_difficulty()
+        words_by_pos = {
+            pos: [w for w in words if w in difficulty and low <= difficulty[w] <= high]
+            for pos, words in words_by_pos.items()
+        }
+    
     # Organize by length for each POS
     nouns = {'short': [], 'medium': [], 'long': []}
     verbs = {'short': [], 'medium': [], 'long': []}
@@ -75,6 +95,24 @@ def save_used_words(used_words):
         json.dump({"used_words": list(used_words)}, f, indent=2)
 
 
+def save_puzzle_history(puzzle):
+    """Save a copy of the puzzle as puzzle_<date>.json in the history folder"""
+    os.makedirs(history_dir, exist_ok=True)
+    path = os.path.join(history_dir, f"puzzle_{puzzle['date']}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(puzzle, f, indent=2)
+    return path
+
+
+def load_puzzle_history(puzzle_date):
+    """Load the saved puzzle for a date from the history folder, if there is one"""
+    path = os.path.join(history_dir, f"puzzle_{puzzle_date.isoformat()}.json")
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return None
+
+
 def load_existing_puzzle():
     """Load existing puzzle if it exists for today"""
     if os.path.exists(output_file):
@@ -109,25 +147,36 @@ number_methods = {
 
 
 # --- PUZZLE GENERATOR ---
-def get_daily_puzzle(used_words_tracker: set, puzzle_date: date=None, allow_reroll_chance=0.5, force_regenerate=False):
+def get_daily_puzzle(used_words_tracker: set, puzzle_date: date=None, allow_reroll_chance=0.5, force_regenerate=False, difficulty_range=None, word_classes=None, sampler=None):
     if puzzle_date is None:
         puzzle_date = date.today()
     
     # Check if puzzle already exists for this date
     if not force_regenerate:
         existing_puzzle = load_existing_puzzle()
-        if existing_puzzle and existing_puzzle.get("date") == puzzle_date.isoformat():
+        if not existing_puzzle or existing_puzzle.get("date") != puzzle_date.isoformat():
+            # A --timezones run may have made it already and saved only the history copy
+            existing_puzzle = load_puzzle_history(puzzle_date)
+        if existing_puzzle:
             print(f"\nPuzzle for {puzzle_date.isoformat()} already exists. Loading existing puzzle...")
             print(f"Words: {[c['word'] for c in existing_puzzle['clues']]}")
             return existing_puzzle
     
-    # Load POS-tagged words
-    nouns, verbs, adjectives = load_word_classes(input_file)
+    # Load POS-tagged words (callers generating many dates pass them in once)
+    if word_classes is None:
+        word_classes = load_word_classes(input_file, difficulty_range)
+    nouns, verbs, adjectives = word_classes
     
     random.seed(puzzle_date.isoformat())  # deterministic per date
 
     # Load words that have already been used
-    used_words = load_used_words()
+    cooldown = isinstance(used_words_tracker, CooldownTracker)
+    if cooldown:
+        # Words whose cooldown ran out by this date can be picked again
+        used_words_tracker.advance_to(puzzle_date)
+        used_words = used_words_tracker
+    else:
+        used_words = load_used_words()
 
     rule_order = list(number_methods.keys())
     random.shuffle(rule_order)
@@ -136,7 +185,11 @@ def get_daily_puzzle(used_words_tracker: set, puzzle_date: date=None, allow_rero
     length_categories = ['short', 'medium', 'long']
     selected_lengths = random.sample(length_categories, 3)  # One of each length
 
-    def pick_word(word_dict, length_cat, rule):
+    def pick_word(word_dict, pos, length_cat, rule):
+        # Weighted pick from the sampler's alias tables, if one was given
+        if sampler is not None:
+            return sampler.pick(pos, length_cat, rule, used_words_tracker)
+        
         words = word_dict[length_cat]
         
         # Filter out words that have already been used
@@ -164,9 +217,9 @@ def get_daily_puzzle(used_words_tracker: set, puzzle_date: date=None, allow_rero
         return random.choice(available_words)
 
     # Assign one length to each word type - NOW USES PROPER POS DICTIONARIES
-    noun = pick_word(nouns, selected_lengths[0], rule_order[0])
-    verb = pick_word(verbs, selected_lengths[1], rule_order[1])
-    adj = pick_word(adjectives, selected_lengths[2], rule_order[2])
+    noun = pick_word(nouns, "noun", selected_lengths[0], rule_order[0])
+    verb = pick_word(verbs, "verb", selected_lengths[1], rule_order[1])
+    adj = pick_word(adjectives, "adjective", selected_lengths[2], rule_order[2])
 
     clues = []
     selected_words_today = []
@@ -195,11 +248,11 @@ def get_daily_puzzle(used_words_tracker: set, puzzle_date: date=None, allow_rero
         old_word = clues[-1]["word"]
         
         if wtype == "NOUN":
-            new_word = pick_word(nouns, length_cat, rule_name)
+            new_word = pick_word(nouns, "noun", length_cat, rule_name)
         elif wtype == "VERB":
-            new_word = pick_word(verbs, length_cat, rule_name)
+            new_word = pick_word(verbs, "verb", length_cat, rule_name)
         else:
-            new_word = pick_word(adjectives, length_cat, rule_name)
+            new_word = pick_word(adjectives, "adjective", length_cat, rule_name)
         
         new_num = number_methods[rule_name](new_word)
         clues[-1] = {
@@ -215,33 +268,95 @@ def get_daily_puzzle(used_words_tracker: set, puzzle_date: date=None, allow_rero
 
     # Mark these words as used
     used_words.update(selected_words_today)
-    save_used_words(used_words)
+    if cooldown:
+        used_words.save(used_words_file)
+    else:
+        save_used_words(used_words)
     
     print(f"\nGenerated NEW puzzle for {puzzle_date.isoformat()}")
     print(f"Words used today: {selected_words_today}")
     print(f"Total words used so far: {len(used_words)}")
 
     # Mark these words as used in the tracker
-    used_words_tracker.update(selected_words_today)
+    if not cooldown:
+        used_words_tracker.update(selected_words_today)
     
     return {"date": puzzle_date.isoformat(), "clues": clues}
 
 
+# --- ROLLING MULTI-TIMEZONE GENERATION ---
+def generate_rolling_puzzles(timezones, now=None, window_hours=48, difficulty_range=None, weighting=None, cooldown_days=None):
+    """
+    Make sure every date that is live in any of `timezones` over the next
+    `window_hours` has a puzzle. Word classes and used words are loaded once;
+    dates that already have a history file are reused, the rest are generated
+    in date order and saved. `weighting` = (weight_by[, low, high]) switches
+    to weighted picks (see weighted_sampling.py); `cooldown_days` lets used
+    words back in after that many days (see cooldown.py). Returns {date: puzzle}.
+    """
+    live = live_puzzle_dates(timezones, now, window_hours)
+    word_classes = load_word_classes(input_file, difficulty_range)
+    used_words = CooldownTracker.load(used_words_file, cooldown_days)
+    sampler = build_sampler(word_classes, *weighting) if weighting else None
+
+    puzzles = {}
+    for puzzle_date, zones in live.items():
+        puzzle = load_puzzle_history(puzzle_date)
+        if puzzle is not None:
+            print(f"\nReusing puzzle for {puzzle_date.isoformat()} ({', '.join(zones)})")
+        else:
+            puzzle = get_daily_puzzle(used_words, puzzle_date, force_regenerate=True, word_classes=word_classes, sampler=sampler)
+            save_puzzle_history(puzzle)
+        puzzles[puzzle_date.isoformat()] = puzzle
+    return puzzles
+
+
 # --- Example Usage ---
 if __name__ == "__main__":
-    
-    # Load already used words
-    used_words = load_used_words()
-    
-    # This will load existing puzzle if it exists, or generate new one if not
-    puzzle = get_daily_puzzle(used_words_tracker=used_words)
-    
-    # Save to daily_words.json
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(puzzle, f, indent=2)
-    
-    print(f"\nPuzzle saved to: {output_file}")
-    print(json.dumps(puzzle, indent=2))
+    parser = argparse.ArgumentParser(description="Generate the daily puzzle.")
+    parser.add_argument("--timezones", nargs="+", help=f"generate every date live in these zones (e.g. {DEFAULT_TIMEZONE} Asia/Kolkata)")
+    parser.add_argument("--window-hours", type=int, default=48)
+    parser.add_argument("--weight-by", choices=["zipf", "difficulty"], help="prefer words whose score is inside --band")
+    parser.add_argument("--band", nargs=2, type=float, metavar=("LOW", "HIGH"),
+                        help="score range to favour (default: zipf 4-6, difficulty 4-8)")
+    parser.add_argument("--difficulty", nargs=2, type=float, metavar=("LOW", "HIGH"),
+                        help="only use words whose word_difficulty.py score is in this range")
+    parser.add_argument("--cooldown-days", type=int, help="let used words be picked again after this many days (default: never)")
+    parser.add_argument("--profile", action="store_true", help="save a profile of this run")
+    args = parser.parse_args()
+
+    profiler = start_profiling("run_daily_puzzle", enabled=args.profile)
+    weighting = (args.weight_by, *(args.band or [])) if args.weight_by else None
+
+    if args.timezones:
+        profiler.phase("generate")
+        puzzles = generate_rolling_puzzles(args.timezones, window_hours=args.window_hours, difficulty_range=args.difficulty,
+                                           weighting=weighting, cooldown_days=args.cooldown_days)
+        profiler.phase(None)
+        print(f"\nLive dates for {', '.join(args.timezones)}: {', '.join(puzzles)}")
+        print(f"History saved to: {history_dir}")
+    else:
+        # Load already used words
+        profiler.phase("load")
+        word_classes = load_word_classes(input_file, args.difficulty)
+        used_words = CooldownTracker.load(used_words_file, args.cooldown_days)
+        
+        # This will load existing puzzle if it exists, or generate new one if not
+        profiler.phase("generate")
+        sampler = build_sampler(word_classes, *weighting) if weighting else None
+        puzzle = get_daily_puzzle(used_words_tracker=used_words, word_classes=word_classes, sampler=sampler)
+        
+        # Save to daily_words.json
+        profiler.phase("write")
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(puzzle, f, indent=2)
+        history_path = save_puzzle_history(puzzle)
+        
+        print(f"\nPuzzle saved to: {output_file}")
+        print(f"History copy saved to: {history_path}")
+        print(json.dumps(puzzle, indent=2))
+
+    profiler.finish()
     
     # If you want to force regenerate (useful for testing), uncomment this:
-    # puzzle = get_daily_puzzle(force_regenerate=True)
\ No newline at end of file
+    # puzzle = get_daily_puzzle(force_regenerate=True)
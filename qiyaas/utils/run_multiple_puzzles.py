@@ -1,33 +1,31 @@
+import argparse
 import random
+import sys
 from datetime import datetime, date
+from profiling import start_profiling
+
+# Only profile when run as a script, not when another module imports this one
+profiler = start_profiling("run_multiple_puzzles", enabled=__name__ == "__main__" and "--profile" in sys.argv)
+profiler.phase("load")
+
 import json
-import re
-import nltk
 from nltk.stem import WordNetLemmatizer
 from nltk.corpus import wordnet as wn
 from zoneinfo import ZoneInfo
+from lexicon import Lexicon, daily_words_lexicon
+from resources import require_nltk
+from puzzle_dates import live_puzzle_dates, DEFAULT_TIMEZONE
 
-# --- Setup: make sure NLTK tagger + WordNet data is available ---
-for pkg in [
-	("taggers/averaged_perceptron_tagger", "averaged_perceptron_tagger"),
-	("corpora/wordnet", "wordnet"),
-	("corpora/omw-1.4", "omw-1.4"),
-]:
-	try:
-		nltk.data.find(pkg[0])
-	except LookupError:
-		nltk.download(pkg[1])
+# --- Setup: make sure WordNet data is available ---
+require_nltk("wordnet", "omw-1.4")
 
-output_file = "qiyaas/data/dailywordsList.js"
+output_file = daily_words_lexicon
 json_file = "qiyaas/data/daily_words.json"
 
 
 # --- WORD CLASS LOADER ---
 def load_word_classes(filename):
-	with open(filename, "r", encoding="utf-8") as f:
-		text = f.read()
-
-	words = re.findall(r'"([A-Za-z]+)"', text)
+	words = Lexicon.load(filename).words()
 	words_lower = [w.lower() for w in words]
 	words_upper_set = set([w.upper() for w in words])  # Create set of valid uppercase words
 	lemmatizer = WordNetLemmatizer()
@@ -67,6 +65,7 @@ def load_word_classes(filename):
 	return sorted(nouns), sorted(verbs), sorted(adjectives)
 
 
+profiler.phase("classify")
 nouns, verbs, adjectives = load_word_classes(output_file)
 
 
@@ -103,11 +102,30 @@ number_methods = {
 	"letter": number_from_letter_of_number,
 }
 
+# Words each rule may pick from (first letter must map to a number, and at least 4 letters)
+rule_filters = {
+	"length": lambda w: len(w) >= 4,
+	"alphabet": lambda w: "A" <= w[0] <= "I" and len(w) >= 4,
+	"letter": lambda w: w[0] in {"O", "T", "F", "S", "E", "N"} and len(w) >= 4,
+}
+
+
+def build_valid_words(type_to_words):
+	"""{(word type, rule): [words]}, filtered once instead of on every pick."""
+	return {
+		(wtype, rule): [w for w in words if keep(w)]
+		for wtype, words in type_to_words.items()
+		for rule, keep in rule_filters.items()
+	}
+
+
+valid_words_by_rule = build_valid_words({"NOUN": nouns, "VERB": verbs, "ADJECTIVE": adjectives})
+
 # --- PUZZLE GENERATOR ---
 def get_daily_puzzle(puzzle_date=None, random_seed=None, max_attempts=20):
 	
 	# Use Eastern Time (America/New_York) for consistency
-	eastern = ZoneInfo("America/New_York")
+	eastern = ZoneInfo(DEFAULT_TIMEZONE)
 	
 	if puzzle_date is None:
 		# Get current date at midnight Eastern Time
@@ -120,7 +138,6 @@ def get_daily_puzzle(puzzle_date=None, random_seed=None, max_attempts=20):
 	random.seed(random_seed)
 
 	word_types = ["NOUN", "VERB", "ADJECTIVE"]
-	type_to_words = {"NOUN": nouns, "VERB": verbs, "ADJECTIVE": adjectives}
 	rule_methods = list(number_methods.keys())
 
 	for _ in range(max_attempts):
@@ -131,14 +148,7 @@ def get_daily_puzzle(puzzle_date=None, random_seed=None, max_attempts=20):
 		success = True
 
 		for wtype, rule in zip(word_types, rule_methods):
-			words_pool = type_to_words[wtype]
-
-			if rule == "alphabet":
-				valid_words = [w for w in words_pool if "A" <= w[0] <= "I" and len(w) >= 4]
-			elif rule == "letter":
-				valid_words = [w for w in words_pool if w[0] in {"O", "T", "F", "S", "E", "N"} and len(w) >= 4]
-			else:
-				valid_words = [w for w in words_pool if len(w) >= 4]
+			valid_words = valid_words_by_rule[(wtype, rule)]
 
 			tries = 0
 			while tries < 10:
@@ -177,57 +187,104 @@ def get_daily_puzzle(puzzle_date=None, random_seed=None, max_attempts=20):
 
 
 # --- MULTIPLE PUZZLES ---
-def save_multiple_puzzles(num_rounds=20, date_for_key=None):
-	eastern = ZoneInfo("America/New_York")
-	
-	if date_for_key is None:
-		# Use current date in Eastern Time
-		now_eastern = datetime.now(eastern)
-		date_for_key = now_eastern.date().isoformat()
+def to_round(puzzle):
+	# Storing both clue answer and their word type
+	return {
+				"clue_1": {
+								"word": puzzle["clue_1"],
+								"type": puzzle["word_types"][0],
+							},
+				
+				"clue_2": {
+								"word": puzzle["clue_2"],
+								"type": puzzle["word_types"][1],
+							},
+				
+				"clue_3": {
+								"word": puzzle["clue_3"],
+								"type": puzzle["word_types"][2],
+							},
+				
+				"numbers_for_clue": puzzle["numbers_for_clue"]
+			}
 
+
+def build_rounds(puzzle_date, num_rounds=20):
+	"""Generate `num_rounds` rounds for one date, seeded from that date."""
 	all_puzzles = {}
-	all_puzzles_with_types = {}  # Keep full data for printing
+	base_seed = int(puzzle_date.strftime("%Y%m%d"))
 	
 	for i in range(num_rounds):
 		
 		# Different seed per round with larger multiplier and offset for more variety
 		# Using prime numbers to ensure good distribution
-		now_eastern = datetime.now(eastern)
-		base_seed = int(now_eastern.strftime("%Y%m%d"))
 		seed = (base_seed * 97) + (i * 191) + 42069  # Large prime multipliers + offset
 		puzzle = get_daily_puzzle(random_seed=seed)
-		
-		# Store full data for printing
-		all_puzzles_with_types[f"round_{i+1}"] = puzzle
-
-		# Store daily puzzle in a JSON file
-		# Storing both clue answer and their word type
-		all_puzzles[f"round_{i+1}"] = {
-											"clue_1": {
-															"word": puzzle["clue_1"],
-															"type": puzzle["word_types"][0],
-														},
-											
-											"clue_2": {
-															"word": puzzle["clue_2"],
-															"type": puzzle["word_types"][1],
-														},
-											
-											"clue_3": {
-															"word": puzzle["clue_3"],
-															"type": puzzle["word_types"][2],
-														},
-											
-											"numbers_for_clue": puzzle["numbers_for_clue"]
-										}
+		all_puzzles[f"round_{i+1}"] = to_round(puzzle)
+	return all_puzzles
+
+
+def save_multiple_puzzles(num_rounds=20, date_for_key=None):
+	eastern = ZoneInfo(DEFAULT_TIMEZONE)
+	
+	if date_for_key is None:
+		# Use current date in Eastern Time
+		now_eastern = datetime.now(eastern)
+		date_for_key = now_eastern.date().isoformat()
+
+	all_puzzles = build_rounds(date.fromisoformat(date_for_key), num_rounds)
 
 	data_to_save = {date_for_key: all_puzzles}
 
+	profiler.phase("write")
 	with open(json_file, "w", encoding="utf-8") as f:
 		json.dump(data_to_save, f, indent=4)
 
 	print(f"\nSaved {num_rounds} rounds to {json_file} under key '{date_for_key}'.")
 	print(f"Using Eastern Time (America/New_York): {datetime.now(eastern).strftime('%Y-%m-%d %H:%M:%S %Z')}")
+
+
+def save_rolling_multiple_puzzles(timezones, num_rounds=20, window_hours=48):
+	"""
+	Save rounds for every date live in any of `timezones` over the next
+	`window_hours` into one file keyed by date. The word classes loaded at
+	import are shared by all dates; dates already in the file are kept as is.
+	"""
+	existing = {}
+	try:
+		with open(json_file, "r", encoding="utf-8") as f:
+			existing = json.load(f)
+	except (FileNotFoundError, json.JSONDecodeError):
+		pass
+
+	data_to_save = {}
+	for puzzle_date, zones in live_puzzle_dates(timezones, window_hours=window_hours).items():
+		key = puzzle_date.isoformat()
+		if isinstance(existing.get(key), dict) and len(existing[key]) == num_rounds:
+			data_to_save[key] = existing[key]
+			print(f"Reusing rounds for {key} ({', '.join(zones)})")
+		else:
+			data_to_save[key] = build_rounds(puzzle_date, num_rounds)
+			print(f"Generated {num_rounds} rounds for {key} ({', '.join(zones)})")
+
+	profiler.phase("write")
+	with open(json_file, "w", encoding="utf-8") as f:
+		json.dump(data_to_save, f, indent=4)
+
+	print(f"\nSaved rounds for {len(data_to_save)} dates to {json_file}.")
+
 	
 if __name__ == "__main__":
-	save_multiple_puzzles(num_rounds=20)
\ No newline at end of file
+	parser = argparse.ArgumentParser(description="Generate practice rounds.")
+	parser.add_argument("--rounds", type=int, default=20)
+	parser.add_argument("--timezones", nargs="+", help=f"generate every date live in these zones (e.g. {DEFAULT_TIMEZONE} Asia/Kolkata)")
+	parser.add_argument("--window-hours", type=int, default=48)
+	parser.add_argument("--profile", action="store_true", help="save a profile of this run")
+	args = parser.parse_args()
+
+	profiler.phase("generate")
+	if args.timezones:
+		save_rolling_multiple_puzzles(args.timezones, args.rounds, args.window_hours)
+	else:
+		save_multiple_puzzles(num_rounds=args.rounds)
+	profiler.finish()
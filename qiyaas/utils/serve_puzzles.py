@@ -0,0 +1,404 @@
+# serve_puzzles.py
+
+# Local stand-in for the Cloudflare worker's read path, for load testing the
+# puzzle files we ship without a Cloudflare account.
+#
+#   GET /puzzle or /          current puzzle (daily_words.json, when it holds a
+#                             run_daily_puzzle.py {date, clues} puzzle)
+#   GET /puzzle/YYYY-MM-DD    puzzle_<date>.json from the history folder, or
+#                             that date's rounds from a run_multiple_puzzles.py file
+#   GET /metrics              cache stats and latency histogram (JSON)
+#
+# Usage:
+#   python qiyaas/utils/serve_puzzles.py serve --port 8787
+#   python qiyaas/utils/serve_puzzles.py loadgen --url http://127.0.0.1:8787
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+from run_daily_puzzle import output_file, history_dir
+
+DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Same headers the worker sends
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type",
+    "Content-Type": "application/json",
+}
+CURRENT_CACHE_HEADERS = {"Cache-Control": "public, max-age=3600, s-maxage=3600"}
+HISTORY_CACHE_HEADERS = {"Cache-Control": "public, max-age=86400, immutable"}
+
+STATUS_TEXT = {
+    200: "OK", 204: "No Content", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+    405: "Method Not Allowed", 413: "Payload Too Large", 429: "Too Many Requests",
+    500: "Internal Server Error", 503: "Service Unavailable",
+}
+
+
+# --- LATENCY HISTOGRAM ---
+class LatencyHistogram:
+    """Power-of-two microsecond buckets: bucket i counts latencies in [2^i, 2^(i+1)) us."""
+
+    def __init__(self, num_buckets=32):
+        self.buckets = [0] * num_buckets
+        self.count = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+
+    def record(self, seconds):
+        us = seconds * 1_000_000
+        index = min(max(int(us), 1).bit_length() - 1, len(self.buckets) - 1)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total_us += us
+        self.max_us = max(self.max_us, us)
+
+    def percentile(self, pct):
+        """Upper bound of the bucket holding the pct-th percentile, in microseconds."""
+        if not self.count:
+            return 0
+        target = self.count * pct / 100
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return 2 ** (i + 1)
+        return 2 ** len(self.buckets)
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_us": round(self.total_us / self.count, 1) if self.count else 0,
+            "max_us": round(self.max_us, 1),
+            "p50_us": self.percentile(50),
+            "p90_us": self.percentile(90),
+            "p99_us": self.percentile(99),
+            "buckets": {f"<{2 ** (i + 1)}us": n for i, n in enumerate(self.buckets) if n},
+        }
+
+
+# --- PUZZLE STORE ---
+class PuzzleStore:
+    """Serves puzzle JSON bytes, keeping recently requested dates in an LRU cache."""
+
+    def __init__(self, current_file=output_file, history=history_dir, cache_size=64):
+        self.current_file = current_file
+        self.history = history
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._current = None
+        self._current_mtime = None
+        self._rounds_by_date = {}
+
+    def current(self):
+        """Current puzzle, reloaded only when daily_words.json changes on disk."""
+        try:
+            mtime = os.stat(self.current_file).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        if mtime != self._current_mtime:
+            with open(self.current_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # Cached dates that came from the previous version of this file are stale
+            for stale in self._rounds_by_date:
+                self.cache.pop(stale, None)
+            if "clues" in data:
+                # run_daily_puzzle.py: a single puzzle
+                self._current = json.dumps(data).encode()
+                self._rounds_by_date = {}
+            else:
+                # run_multiple_puzzles.py: {date: {round_n: ...}}. Its rounds are served by
+                # date, but they are not a {date, clues} puzzle, so there is no current one
+                self._rounds_by_date = {d: json.dumps(rounds).encode() for d, rounds in data.items()}
+                self._current = None
+            self._current_mtime = mtime
+        return self._current
+
+    def get(self, puzzle_date):
+        try:
+            self.current()  # drops cached rounds if daily_words.json changed
+        except ValueError:
+            pass  # half-written daily_words.json; history files can still be served
+        if puzzle_date in self.cache:
+            self.cache.move_to_end(puzzle_date)
+            self.hits += 1
+            return self.cache[puzzle_date]
+
+        self.misses += 1
+        body = self._read(puzzle_date)
+        if body is not None:
+            self.cache[puzzle_date] = body
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return body
+
+    def _read(self, puzzle_date):
+        path = os.path.join(self.history, f"puzzle_{puzzle_date}.json")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read()
+        return self._rounds_by_date.get(puzzle_date)
+
+    def dates(self):
+        """Every date the store can serve."""
+        found = set(self._rounds_by_date)
+        if os.path.isdir(self.history):
+            for name in os.listdir(self.history):
+                match = re.match(r"^puzzle_(\d{4}-\d{2}-\d{2})\.json$", name)
+                if match:
+                    found.add(match.group(1))
+        return sorted(found)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.cache), "capacity": self.cache_size}
+
+
+# --- HTTP SERVER ---
+def build_response(status, body=b"", headers=None, keep_alive=True):
+    lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}"]
+    for name, value in {**CORS_HEADERS, **(headers or {})}.items():
+        lines.append(f"{name}: {value}")
+    lines.append(f"Content-Length: {len(body)}")
+    lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+
+
+def error_body(message):
+    return json.dumps({"error": message}).encode()
+
+
+async def read_headers(reader):
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+async def read_request(reader):
+    """
+    Return (method, target, headers, body) for the next request on the
+    connection, or None when the client has closed it. HTTP/1.0 requests get
+    "connection: close" unless they asked for keep-alive.
+    """
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    headers = await read_headers(reader)
+    length = int(headers.get("content-length", 0))
+    body = await reader.readexactly(length) if length else b""
+
+    parts = request_line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise ValueError(f"malformed request line: {request_line!r}")
+    method, target, version = parts
+    if version != "HTTP/1.1":
+        headers.setdefault("connection", "close")
+    return method, target, headers, body
+
+
+class PuzzleServer:
+    def __init__(self, store):
+        self.store = store
+        self.latency = LatencyHistogram()
+        self.started = time.time()
+
+    def route(self, method, path):
+        """Return (status, body, extra headers) for one request."""
+        if method == "OPTIONS":
+            return 204, b"", None
+        if method != "GET":
+            return 405, error_body("Method Not Allowed"), None
+
+        if path == "/metrics":
+            metrics = {
+                "uptime_seconds": round(time.time() - self.started, 1),
+                "cache": self.store.stats(),
+                "latency": self.latency.summary(),
+            }
+            return 200, json.dumps(metrics).encode(), None
+
+        if path.startswith("/puzzle/") and len(path) > 8:
+            puzzle_date = path[8:]
+            if not DATE_PATTERN.match(puzzle_date):
+                return 400, error_body("Invalid date format. Use YYYY-MM-DD"), None
+            body = self.store.get(puzzle_date)
+            if body is None:
+                return 404, error_body(f"No puzzle for {puzzle_date}"), None
+            return 200, body, HISTORY_CACHE_HEADERS
+
+        if path in ("/puzzle", "/"):
+            body = self.store.current()
+            if body is None:
+                return 404, error_body("No puzzle available"), None
+            return 200, body, CURRENT_CACHE_HEADERS
+
+        return 404, error_body("Not Found"), None
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except ValueError:
+                    writer.write(build_response(400, error_body("Bad Request"), keep_alive=False))
+                    break
+                if request is None:
+                    break
+                start = time.perf_counter()
+
+                method, target, headers, _ = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                path = urlsplit(target).path
+                try:
+                    status, body, extra = self.route(method, path)
+                except Exception as e:  # e.g. a half-written daily_words.json
+                    status, body, extra = 500, error_body(str(e) or type(e).__name__), None
+                writer.write(build_response(status, body, extra, keep_alive))
+                await writer.drain()
+                if path != "/metrics":
+                    self.latency.record(time.perf_counter() - start)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host, port, store):
+    server = PuzzleServer(store)
+    listener = await asyncio.start_server(server.handle, host, port)
+    print(f"Serving {len(store.dates())} dated puzzles on http://{host}:{port} (cache size {store.cache_size})")
+    async with listener:
+        await listener.serve_forever()
+
+
+# --- LOAD GENERATOR ---
+async def read_response(reader):
+    """Return (status, headers, body) for the next response on the connection."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("server closed the connection")
+    status = int(status_line.split()[1])
+    headers = await read_headers(reader)
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await read_headers(reader)  # trailers
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        return status, headers, b"".join(chunks)
+
+    length = int(headers.get("content-length", 0))
+    body = await reader.readexactly(length) if length else b""
+    return status, headers, body
+
+
+def build_request_paths(dates, total, hot_dates=7, hot_share=0.8, current_share=0.5, seed=0):
+    """
+    Request mix: `current_share` of requests hit /puzzle, the rest hit dated
+    puzzles, `hot_share` of which go to the `hot_dates` most recent dates.
+    """
+    rng = random.Random(seed)
+    hot = dates[-hot_dates:]
+    paths = []
+    for _ in range(total):
+        if not dates or rng.random() < current_share:
+            paths.append("/puzzle")
+        elif rng.random() < hot_share:
+            paths.append(f"/puzzle/{rng.choice(hot)}")
+        else:
+            paths.append(f"/puzzle/{rng.choice(dates)}")
+    return paths
+
+
+async def run_load(url, paths, connections):
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    queue = asyncio.Queue()
+    for path in paths:
+        queue.put_nowait(path)
+
+    latency = LatencyHistogram()
+    statuses = {}
+
+    async def worker():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while not queue.empty():
+                path = queue.get_nowait()
+                start = time.perf_counter()
+                writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+                await writer.drain()
+                status, _, _ = await read_response(reader)
+                latency.record(time.perf_counter() - start)
+                statuses[status] = statuses.get(status, 0) + 1
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+    return {
+        "requests": len(paths),
+        "connections": connections,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(len(paths) / elapsed, 1) if elapsed else None,
+        "statuses": statuses,
+        "latency": latency.summary(),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local puzzle server and load generator.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_cmd = commands.add_parser("serve", help="serve puzzles from local files")
+    serve_cmd.add_argument("--host", default="127.0.0.1")
+    serve_cmd.add_argument("--port", type=int, default=8787)
+    serve_cmd.add_argument("--cache-size", type=int, default=64, help="number of dates kept in the LRU cache")
+
+    load_cmd = commands.add_parser("loadgen", help="send requests to a running server")
+    load_cmd.add_argument("--url", default="http://127.0.0.1:8787")
+    load_cmd.add_argument("--requests", type=int, default=10000)
+    load_cmd.add_argument("--connections", type=int, default=32)
+    load_cmd.add_argument("--hot-dates", type=int, default=7)
+    load_cmd.add_argument("--seed", type=int, default=0)
+    load_cmd.add_argument("--output", help="write the report to this JSON file")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        try:
+            asyncio.run(serve(args.host, args.port, PuzzleStore(cache_size=args.cache_size)))
+        except KeyboardInterrupt:
+            pass
+    else:
+        store = PuzzleStore()
+        store.current()
+        paths = build_request_paths(store.dates(), args.requests, hot_dates=args.hot_dates, seed=args.seed)
+        report = asyncio.run(run_load(args.url, paths, args.connections))
+        print(json.dumps(report, indent=2))
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            print(f"\nReport saved to: {args.output}")
@@ -0,0 +1,213 @@
+# weighted_sampling.py
+
+# Weighted word picks for run_daily_puzzle.py. Each (POS, length, rule)
+# bucket gets a Vose alias table over its unused words, so a pick is two
+# random numbers no matter how big the bucket is. A table is kept together
+# with the set of the bucket's words that were used when it was built, and
+# is only rebuilt when that set changes (a word gets used or comes off
+# cooldown) -- a few times a day, not on every pick.
+#
+# Picks draw from the global `random` module, which get_daily_puzzle seeds
+# with the date. Because a table depends only on its bucket and the used
+# words in it, a sampler that has already served other dates gives the
+# same puzzle as a fresh one (see --check).
+#
+#   python qiyaas/utils/weighted_sampling.py --check
+
+import argparse
+import json
+import math
+import os
+import random
+
+from word_difficulty import load_word_difficulty
+
+zipf_file = "qiyaas/data/intmed/daily_words_zipf.json"
+tagged_file = "qiyaas/data/intmed/daily_words_tagged.json"
+
+# Default --band per weighting: Zipf frequency (common everyday words) and
+# word_difficulty.py score (average wrong guesses, middle of the pool)
+DEFAULT_BANDS = {"zipf": (4.0, 6.0), "difficulty": (4.0, 8.0)}
+
+# Same first-letter constraints pick_word applies per rule
+RULE_FILTERS = {
+    "length_rule": lambda w: True,
+    "alphabet_rule": lambda w: 'A' <= w[0].upper() <= 'I',
+    "number_rule": lambda w: w[0].upper() in {'O', 'T', 'F', 'S', 'E', 'N'},
+}
+
+
+class AliasTable:
+    """Vose's alias method: O(n) to build, O(1) per sample."""
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = sum(weights)
+        if n == 0 or total <= 0:
+            raise ValueError("AliasTable needs at least one positive weight")
+
+        scaled = [w * n / total for w in weights]
+        self.prob = [0.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def sample(self, rng=random):
+        i = int(rng.random() * len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+def load_zipf_scores(filename=zipf_file, words_file=tagged_file):
+    """
+    {WORD: Zipf frequency}, as saved by extract_daily_words.py. When the file
+    is missing the scores of every word in `words_file` (the full tagged
+    pool, not a --difficulty subset) are computed with wordfreq and saved.
+    """
+    if os.path.exists(filename):
+        with open(filename, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    from wordfreq import zipf_frequency
+
+    with open(words_file, "r", encoding="utf-8") as f:
+        words = [w for pos_words in json.load(f).values() for w in pos_words]
+    scores = {w.upper(): zipf_frequency(w.lower(), "en") for w in sorted(set(words))}
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(scores, f, indent=2)
+    print(f"Zipf scores saved to: {filename}")
+    return scores
+
+
+def band_weights(scores, low, high, falloff=1.0, floor=1e-3):
+    """
+    Weight function favouring words whose score is inside [low, high]: 1
+    inside the band, decaying exponentially with distance outside it. Words
+    without a score get `floor`, so they stay possible but rare.
+    """
+    def weight(word):
+        score = scores.get(word)
+        if score is None:
+            return floor
+        distance = max(low - score, 0, score - high)
+        return max(math.exp(-distance / falloff), floor)
+    return weight
+
+
+class _Bucket:
+    def __init__(self, words, weight):
+        weighted = [(w, weight(w)) for w in words]
+        self.words = [w for w, wt in weighted if wt > 0]
+        self.weights = [wt for _, wt in weighted if wt > 0]
+        self.members = set(self.words)
+        self.used = None  # used words in this bucket when `table` was built
+        self.left = []
+        self.table = None
+
+    def used_in(self, used):
+        if len(used) < len(self.members):
+            return frozenset(w for w in used if w in self.members)
+        return frozenset(w for w in self.members if w in used)
+
+    def rebuild(self, used):
+        left = [(w, wt) for w, wt in zip(self.words, self.weights) if w not in used]
+        self.used = used
+        self.left = [w for w, _ in left]
+        self.table = AliasTable([wt for _, wt in left]) if left else None
+
+
+class WeightedSampler:
+    def __init__(self, word_classes, weight):
+        """
+        `word_classes` is the (nouns, verbs, adjectives) tuple from
+        load_word_classes(); `weight` maps a word to a non-negative weight.
+        """
+        nouns, verbs, adjectives = word_classes
+        self.word_dicts = {"noun": nouns, "verb": verbs, "adjective": adjectives}
+        self.weight = weight
+        self.buckets = {}
+
+    def _bucket(self, key):
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            pos, length_cat, rule = key
+            words = [w for w in self.word_dicts[pos][length_cat] if RULE_FILTERS[rule](w)]
+            bucket = self.buckets[key] = _Bucket(words, self.weight)
+        return bucket
+
+    def pick(self, pos, length_cat, rule, used):
+        """Weighted pick of an unused word from the (pos, length_cat, rule) bucket."""
+        bucket = self._bucket((pos, length_cat, rule))
+        bucket_used = bucket.used_in(used)
+        if bucket_used != bucket.used:
+            bucket.rebuild(bucket_used)
+        if bucket.table is None:
+            raise ValueError(f"No unused {length_cat} {pos} words left for {rule}!")
+        return bucket.left[bucket.table.sample()]
+
+
+def build_sampler(word_classes, weight_by, low=None, high=None, falloff=1.0):
+    """
+    Sampler weighting words by "zipf" or "difficulty" towards [low, high]
+    (DEFAULT_BANDS[weight_by] when not given).
+    """
+    if low is None or high is None:
+        low, high = DEFAULT_BANDS[weight_by]
+    if weight_by == "zipf":
+        scores = load_zipf_scores()
+    else:
+        scores = load_word_difficulty()
+    return WeightedSampler(word_classes, band_weights(scores, low, high, falloff))
+
+
+def check_warm_equals_cold(word_classes, weight_by, days=60):
+    """
+    Play `days` dates on one long-lived sampler and, for each date, on a
+    fresh sampler with the same used words. Returns the first date where
+    they disagree, or None.
+    """
+    warm = build_sampler(word_classes, weight_by)
+    keys = [(pos, length_cat, rule) for pos in ("noun", "verb", "adjective")
+            for length_cat in ("short", "medium", "long") for rule in RULE_FILTERS]
+    def pick_or_none(sampler, key, used):
+        try:
+            return sampler.pick(*key, used)
+        except ValueError:  # bucket used up; both samplers must agree on that too
+            return None
+
+    used = set()
+    for day in range(days):
+        seed = f"check-{day}"
+        cold = build_sampler(word_classes, weight_by)
+        picks = []
+        for sampler in (warm, cold):
+            random.seed(seed)
+            picks.append([pick_or_none(sampler, key, used) for key in keys])
+        if picks[0] != picks[1]:
+            return seed
+        used.update(w for w in picks[0] if w is not None)
+    return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Weighted word sampling checks.")
+    parser.add_argument("--check", action="store_true", help="check that warm and fresh samplers pick the same words")
+    parser.add_argument("--weight-by", choices=DEFAULT_BANDS, default="difficulty")
+    parser.add_argument("--days", type=int, default=60)
+    args = parser.parse_args()
+
+    if args.check:
+        from run_daily_puzzle import load_word_classes
+
+        mismatch = check_warm_equals_cold(load_word_classes(), args.weight_by, args.days)
+        if mismatch:
+            raise SystemExit(f"Warm and fresh samplers disagree on {mismatch}")
+        print(f"Warm and fresh samplers agree on {args.days} dates ({args.weight_by} weighting)")
@@ -0,0 +1,153 @@
+# word_difficulty.py
+
+# Scores how hard each word in the daily pool is to uncover letter by letter
+# by playing two standard guessing strategies against every word:
+#
+#   frequency  guess letters in a fixed order, most common letter first
+#              (counted over the words of the same length)
+#   entropy    always guess the letter whose reveal splits the remaining
+#              candidates most evenly (highest entropy), then recurse
+#
+# A word's score is the average number of wrong guesses across strategies.
+#
+# Both strategies run over every word of a length at once using the bitmaps
+# from pattern_index.py: the frequency strategy keeps its per-word miss
+# counters as bit-sliced ints, and the entropy strategy walks one decision
+# tree whose nodes are candidate bitmaps, so no word is simulated on its own.
+
+import json
+import math
+import time
+
+from pattern_index import PatternIndex, iter_bits, daily_words_file, load_words
+
+output_path = "qiyaas/data/intmed/word_difficulty.json"
+
+
+def add_to_counters(planes, mask):
+    """Add 1 to the counter of every word whose bit is set in `mask`."""
+    carry = mask
+    for i in range(len(planes)):
+        planes[i], carry = planes[i] ^ carry, planes[i] & carry
+        if not carry:
+            return
+    planes.append(carry)
+
+
+def decode_counters(planes, n):
+    counts = [0] * n
+    for i, plane in enumerate(planes):
+        for bit in iter_bits(plane):
+            counts[bit] += 1 << i
+    return counts
+
+
+# --- FREQUENCY STRATEGY ---
+def frequency_misses(index, length):
+    """Wrong guesses per word when letters are guessed in frequency order."""
+    contains = index.contains[length]
+    order = sorted(range(26), key=lambda i: (-contains[i].bit_count(), i))
+
+    # unsolved[t] = words still missing a letter before guess t is made
+    unsolved = [0] * (len(order) + 1)
+    for t in range(len(order) - 1, -1, -1):
+        unsolved[t] = unsolved[t + 1] | contains[order[t]]
+
+    planes = []
+    for t, letter in enumerate(order):
+        add_to_counters(planes, unsolved[t] & ~contains[letter])
+    return decode_counters(planes, len(index.words[length]))
+
+
+# --- ENTROPY STRATEGY ---
+def split_by_letter(index, length, mask, letter):
+    """Split `mask` into groups of words that show the same pattern for `letter`."""
+    at = index.at[length]
+    groups = [mask & ~index.contains[length][letter], mask & index.contains[length][letter]]
+    for pos in range(length):
+        refined = []
+        for group in groups:
+            if not group:
+                continue
+            inside = group & at[pos][letter]
+            if inside and inside != group:
+                refined.extend([inside, group & ~inside])
+            else:
+                refined.append(group)
+        groups = refined
+    return [g for g in groups if g]
+
+
+def entropy_misses(index, length):
+    """Wrong guesses per word when every guess maximises the entropy of the reveal."""
+    contains = index.contains[length]
+    misses = [0] * len(index.words[length])
+
+    stack = [(index.full[length], 0, 0)]  # (candidates, guessed letters bitmask, misses so far)
+    while stack:
+        mask, guessed, missed = stack.pop()
+        total = mask.bit_count()
+        if total == 1:
+            misses[mask.bit_length() - 1] = missed
+            continue
+
+        best = None
+        for letter in range(26):
+            if guessed >> letter & 1:
+                continue
+            hits = (mask & contains[letter]).bit_count()
+            if not hits:
+                continue
+            groups = split_by_letter(index, length, mask, letter)
+            if len(groups) == 1:
+                continue  # reveals nothing about which candidate it is
+            entropy = -sum(g.bit_count() / total * math.log2(g.bit_count() / total) for g in groups)
+            key = (entropy, hits, -letter)
+            if best is None or key > best[0]:
+                best = (key, letter, groups)
+
+        _, letter, groups = best
+        for group in groups:
+            miss = 0 if group & contains[letter] else 1
+            stack.append((group, guessed | 1 << letter, missed + miss))
+    return misses
+
+
+STRATEGIES = {
+    "frequency": frequency_misses,
+    "entropy": entropy_misses,
+}
+
+
+def score_words(words):
+    """Return {word: {"<strategy>_misses": n, ..., "score": mean misses}}."""
+    index = PatternIndex(words)
+    results = {}
+    for length, group in index.words.items():
+        per_strategy = {name: simulate(index, length) for name, simulate in STRATEGIES.items()}
+        for i, word in enumerate(group):
+            entry = {f"{name}_misses": misses[i] for name, misses in per_strategy.items()}
+            entry["score"] = round(sum(misses[i] for misses in per_strategy.values()) / len(STRATEGIES), 2)
+            results[word] = entry
+    return results
+
+
+def load_word_difficulty(filename=output_path):
+    """Load {word: score} from the saved difficulty file."""
+    with open(filename, "r", encoding="utf-8") as f:
+        return {word: entry["score"] for word, entry in json.load(f).items()}
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    words = load_words(daily_words_file)
+    results = score_words(words)
+    elapsed = time.perf_counter() - start
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(results.items())), f, indent=2)
+
+    scores = sorted(entry["score"] for entry in results.values())
+    print(f"Scored {len(results)} words in {elapsed:.2f} s")
+    print(f"  Easiest: {scores[0]}  Median: {scores[len(scores) // 2]}  Hardest: {scores[-1]}")
+    print(f"Difficulty saved to: {output_path}")